@@ -79,7 +79,7 @@ class UserProfileImportWizard:
             if row_data.get('osztaly_start_year') and row_data.get('osztaly_szekcio'):
                 osztaly, _ = Osztaly.objects.get_or_create(
                     startYear=int(row_data['osztaly_start_year']),
-                    szekcio=row_data['osztaly_szekcio']
+                    szekcio=row_data['osztaly_szekcio'].upper()
                 )
             
             # Create or update profile
@@ -172,7 +172,7 @@ class ProfileImport:
                     osztaly_data = validated_data.pop('osztaly')
                     osztaly, _ = Osztaly.objects.get_or_create(
                         startYear=osztaly_data['startYear'],
-                        szekcio=osztaly_data['szekcio']
+                        szekcio=osztaly_data['szekcio'].upper()
                     )
                 
                 return Profile.objects.create(
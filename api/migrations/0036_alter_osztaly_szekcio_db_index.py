@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0035_remove_osztaly_tanev_field'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='osztaly',
+            name='szekcio',
+            field=models.CharField(db_index=True, help_text='Az osztály szekciója (pl. F, A, B, stb.)', max_length=1, verbose_name='Szekció'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-18
+
+from django.db import migrations
+from django.db.models.functions import Upper
+
+
+def forwards(apps, schema_editor):
+    Osztaly = apps.get_model('api', 'Osztaly')
+    Osztaly.objects.update(szekcio=Upper('szekcio'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0036_alter_osztaly_szekcio_db_index'),
+    ]
+
+    operations = [
+        # Data migration: a szekció szerinti szűrés pontos (nagybetűs) egyezést
+        # használ, ezért a korábban kisbetűvel mentett szekciókat normalizáljuk.
+        migrations.RunPython(forwards, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0037_uppercase_osztaly_szekcio'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='forgatas',
+            name='date',
+            field=models.DateField(db_index=True, help_text='A forgatás dátuma', verbose_name='Dátum'),
+        ),
+        migrations.AddIndex(
+            model_name='beosztas',
+            index=models.Index(fields=['kesz', '-created_at'], name='beosztas_kesz_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='beosztas',
+            index=models.Index(fields=['stab', 'kesz', '-created_at'], name='beosztas_stab_kesz_created_idx'),
+        ),
+    ]
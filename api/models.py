@@ -1,9 +1,13 @@
 from django.db import models
 from django.contrib.auth.models import User
 from datetime import datetime, date, timedelta, time
-from django.db.models.signals import m2m_changed, pre_save, post_save
+from django.db.models.signals import m2m_changed, pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+import logging
+
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Utility Functions for Timezone Handling
@@ -86,9 +90,8 @@ def hash_unhashed_password(sender, instance, **kwargs):
         pass
     
     # Hash the plain text password
-    original_password = instance.password
     instance.password = make_password(instance.password)
-    print(f"🔐 Password auto-hashed for user: {instance.username} (was: {original_password[:10]}...)")
+    logger.debug(f"Password auto-hashed for user: {instance.username}")
 
 # ============================================================================
 # MODEL DEFINITIONS
@@ -129,10 +132,35 @@ class Tanev(models.Model):
             check_date = date.today()
         return cls.objects.filter(start_date__lte=check_date, end_date__gte=check_date).first()
 
+    # Az aktív tanév legfeljebb tanévváltáskor változik, ezért az azonosítóját
+    # gyorsítótárazzuk. A kulcs tartalmazza a dátumot, így éjfélkor magától
+    # frissül; mentéskor és törléskor a signal handler
+    # (invalidate_active_tanev_cache) törli. A cache minden worker folyamat
+    # között közös (settings.CACHES), így a törlés mindegyikben érvényesül.
+    # Csak az id kerül a cache-be, a példányt mindig az adatbázisból töltjük,
+    # így egy elavult bejegyzés (pl. signal nélkül törölt tanév) nem juthat
+    # idegen kulcsként mentésbe.
+    ACTIVE_CACHE_TIMEOUT = 3600
+
+    @classmethod
+    def active_cache_key(cls):
+        return f"tanev:active:{date.today().isoformat()}"
+
     @classmethod
     def get_active(cls):
-        """Az aktuális tanév (a mai dátum alapján)."""
-        return cls.get_current_by_date()
+        """Az aktuális tanév (a mai dátum alapján), az azonosítója gyorsítótárazva."""
+        cache_key = cls.active_cache_key()
+        cached_id = cache.get(cache_key)
+        if cached_id:
+            active = cls.objects.filter(pk=cached_id).first()
+            if active is not None and active.start_date <= date.today() <= active.end_date:
+                return active
+        elif cached_id is not None:
+            # 0 jelöli, hogy nincs aktív tanév
+            return None
+        active = cls.get_current_by_date()
+        cache.set(cache_key, active.id if active else 0, cls.ACTIVE_CACHE_TIMEOUT)
+        return active
 
     @classmethod
     def create_for_year(cls, start_year):
@@ -160,6 +188,12 @@ class Tanev(models.Model):
         return self.osztalyok.filter(szekcio=szekcio)
 
 
+@receiver([post_save, post_delete], sender=Tanev)
+def invalidate_active_tanev_cache(sender, instance, **kwargs):
+    """Tanév létrehozásakor, módosításakor vagy törlésekor az aktív tanév újraszámolandó."""
+    cache.delete(Tanev.active_cache_key())
+
+
 class Profile(models.Model):
     ADMIN_TYPES = [
         ('none', 'Nincs adminisztrátor jogosultság'),
@@ -290,7 +324,7 @@ class Profile(models.Model):
             return Osztaly.objects.filter(osztaly_fonokei=self.user).exists()
         except Exception as e:
             # Log the error for debugging purposes
-            print(f"Error in is_osztaly_fonok: {e}")
+            logger.error(f"Error in is_osztaly_fonok: {e}")
             return False
     
     @property 
@@ -426,7 +460,7 @@ class Atigazolas(models.Model):
 class Osztaly(models.Model):
     startYear = models.IntegerField(blank=False, null=False, verbose_name='Indulási év', 
                                    help_text='Az év, amikor az osztály első alkalommal megkezdte tanulmányait')
-    szekcio = models.CharField(max_length=1, blank=False, null=False, verbose_name='Szekció', 
+    szekcio = models.CharField(max_length=1, blank=False, null=False, db_index=True, verbose_name='Szekció', 
                               help_text='Az osztály szekciója (pl. F, A, B, stb.)')
     osztaly_fonokei = models.ManyToManyField('auth.User', blank=True, related_name='osztaly_fonokei', 
                                            verbose_name='Osztályfőnökei', 
@@ -438,6 +472,13 @@ class Osztaly(models.Model):
         # egy osztály melyik tanévben aktív).
         return self.get_current_year_name()
 
+    def save(self, *args, **kwargs):
+        # A szekciót mindig nagybetűsen tároljuk, így a szekció szerinti
+        # szűrés pontos egyezéssel, indexből mehet (nem kell iexact).
+        if self.szekcio:
+            self.szekcio = self.szekcio.upper()
+        super().save(*args, **kwargs)
+
     def get_current_year_name(self, reference_tanev=None):
         """Az osztály neve egy adott tanévhez viszonyítva.
 
@@ -448,7 +489,15 @@ class Osztaly(models.Model):
         """
         if reference_tanev is None:
             reference_tanev = Tanev.get_active()
+        return self.get_year_name_for_tanev(reference_tanev)
 
+    def get_year_name_for_tanev(self, reference_tanev):
+        """Az osztály neve a megadott tanévhez viszonyítva, adatbázis-lekérdezés nélkül.
+
+        Listázásnál az aktív tanévet kérésenként egyszer kérdezzük le, és ezt
+        adjuk át minden osztálynak. ``None`` esetén (nincs aktív tanév) a
+        naptári becslést használjuk, ugyanúgy, mint ``get_current_year_name``.
+        """
         szekcio = self.szekcio.upper()
 
         if reference_tanev is not None:
@@ -629,7 +678,7 @@ class Forgatas(models.Model):
                            help_text='A forgatás egyedi neve')
     description = models.TextField(max_length=500, blank=False, null=False, verbose_name='Leírás', 
                                   help_text='A forgatás részletes leírása (maximum 500 karakter)')
-    date = models.DateField(blank=False, null=False, verbose_name='Dátum', 
+    date = models.DateField(blank=False, null=False, db_index=True, verbose_name='Dátum', 
                            help_text='A forgatás dátuma')
     timeFrom = models.TimeField(blank=False, null=False, verbose_name='Kezdés ideje', 
                                help_text='A forgatás kezdési időpontja')
@@ -1111,12 +1160,12 @@ class Beosztas(models.Model):
         Automatically create/update/delete absence records based on assignment changes
         Creates absences for all assignments with forgatas, regardless of kesz status
         """
-        print(f"[DEBUG] update_absence_records called for Beosztas {self.id}")
-        print(f"[DEBUG] - forgatas: {self.forgatas}")
-        print(f"[DEBUG] - kesz: {self.kesz}")
+        logger.debug(f"update_absence_records called for Beosztas {self.id}")
+        logger.debug(f"- forgatas: {self.forgatas}")
+        logger.debug(f"- kesz: {self.kesz}")
         
         if not self.forgatas:
-            print(f"[DEBUG] No forgatas found, cleaning up existing absences")
+            logger.debug("No forgatas found, cleaning up existing absences")
             # If no forgatas, clean up any existing absences
             self.clean_absence_records()
             return
@@ -1126,7 +1175,7 @@ class Beosztas(models.Model):
         for relacio in self.szerepkor_relaciok.all():
             current_users.add(relacio.user)
         
-        print(f"[DEBUG] Current users assigned: {[u.get_full_name() for u in current_users]}")
+        logger.debug(f"Current users assigned: {len(current_users)}")
         
         # Get old users if this was an update
         old_users = set()
@@ -1134,32 +1183,32 @@ class Beosztas(models.Model):
             for relacio in old_szerepkor_relaciok:
                 old_users.add(relacio.user)
         
-        print(f"[DEBUG] Old users assigned: {[u.get_full_name() for u in old_users]}")
+        logger.debug(f"Old users assigned: {len(old_users)}")
         
         # Create absence records for newly assigned users
         new_users = current_users - old_users
-        print(f"[DEBUG] New users to create absences for: {[u.get_full_name() for u in new_users]}")
+        logger.debug(f"New users to create absences for: {len(new_users)}")
         for user in new_users:
-            print(f"[DEBUG] Creating absence for user: {user.get_full_name()}")
+            logger.debug(f"Creating absence for user: {user.get_full_name()}")
             self.create_absence_for_user(user)
         
         # Remove absence records for users no longer assigned
         removed_users = old_users - current_users
-        print(f"[DEBUG] Users to remove absences for: {[u.get_full_name() for u in removed_users]}")
+        logger.debug(f"Users to remove absences for: {len(removed_users)}")
         for user in removed_users:
-            print(f"[DEBUG] Removing absence for user: {user.get_full_name()}")
+            logger.debug(f"Removing absence for user: {user.get_full_name()}")
             self.remove_absence_for_user(user)
         
         # For existing users, ensure they have absence records (in case they were missing)
         existing_users = current_users & old_users if old_users else current_users
-        print(f"[DEBUG] Existing users to check/update: {[u.get_full_name() for u in existing_users]}")
+        logger.debug(f"Existing users to check/update: {len(existing_users)}")
         for user in existing_users:
             # Always ensure absence exists, create if missing
             if not Absence.objects.filter(diak=user, forgatas=self.forgatas, auto_generated=True).exists():
-                print(f"[DEBUG] Missing absence for existing user {user.get_full_name()}, creating...")
+                logger.debug(f"Missing absence for existing user {user.get_full_name()}, creating...")
                 self.create_absence_for_user(user)
             else:
-                print(f"[DEBUG] Absence exists for user {user.get_full_name()}, updating if needed...")
+                logger.debug(f"Absence exists for user {user.get_full_name()}, updating if needed...")
                 self.update_absence_for_user(user)
         
         # Update existing absence records if forgatas details changed
@@ -1168,22 +1217,22 @@ class Beosztas(models.Model):
             old_forgatas.timeFrom != self.forgatas.timeFrom or 
             old_forgatas.timeTo != self.forgatas.timeTo
         ):
-            print(f"[DEBUG] Forgatas details changed, updating all existing absences")
+            logger.debug("Forgatas details changed, updating all existing absences")
             # Update all existing absence records with new timing
             for user in current_users:
-                print(f"[DEBUG] Updating absence timing for user: {user.get_full_name()}")
+                logger.debug(f"Updating absence timing for user: {user.get_full_name()}")
                 self.update_absence_for_user(user)
     
     def create_absence_for_user(self, user):
         """Create an absence record for a user assigned to this forgatas"""
         if not self.forgatas:
-            print(f"[DEBUG] Cannot create absence - no forgatas")
+            logger.debug("Cannot create absence - no forgatas")
             return
         
-        print(f"[DEBUG] create_absence_for_user called for user: {user.get_full_name()}")
-        print(f"[DEBUG] - forgatas: {self.forgatas.name}")
-        print(f"[DEBUG] - date: {self.forgatas.date}")
-        print(f"[DEBUG] - time: {self.forgatas.timeFrom} - {self.forgatas.timeTo}")
+        logger.debug(f"create_absence_for_user called for user: {user.get_full_name()}")
+        logger.debug(f"- forgatas: {self.forgatas.name}")
+        logger.debug(f"- date: {self.forgatas.date}")
+        logger.debug(f"- time: {self.forgatas.timeFrom} - {self.forgatas.timeTo}")
         
         # Check if auto-generated absence already exists to avoid duplicates
         existing_absence = Absence.objects.filter(
@@ -1193,13 +1242,13 @@ class Beosztas(models.Model):
         ).first()
         
         if existing_absence:
-            print(f"[DEBUG] Auto-generated absence already exists for {user.get_full_name()}, updating instead")
+            logger.debug(f"Auto-generated absence already exists for {user.get_full_name()}, updating instead")
             # Update the existing one instead of creating duplicate
             existing_absence.date = self.forgatas.date
             existing_absence.timeFrom = self.forgatas.timeFrom
             existing_absence.timeTo = self.forgatas.timeTo
             existing_absence.save()
-            print(f"[DEBUG] Updated existing absence #{existing_absence.id}")
+            logger.debug(f"Updated existing absence #{existing_absence.id}")
         else:
             try:
                 new_absence = Absence.objects.create(
@@ -1212,17 +1261,17 @@ class Beosztas(models.Model):
                     unexcused=False,
                     auto_generated=True  # Mark as auto-generated
                 )
-                print(f"[SUCCESS] Created new absence #{new_absence.id} for {user.get_full_name()}")
+                logger.info(f"Created new absence #{new_absence.id} for {user.get_full_name()}")
             except Exception as e:
-                print(f"[ERROR] Failed to create absence for {user.get_full_name()}: {e}")
+                logger.error(f"Failed to create absence for {user.get_full_name()}: {e}")
     
     def update_absence_for_user(self, user):
         """Update existing absence record for a user when forgatas details change"""
         if not self.forgatas:
-            print(f"[DEBUG] Cannot update absence - no forgatas")
+            logger.debug("Cannot update absence - no forgatas")
             return
         
-        print(f"[DEBUG] update_absence_for_user called for user: {user.get_full_name()}")
+        logger.debug(f"update_absence_for_user called for user: {user.get_full_name()}")
         
         try:
             # Look for auto-generated absence first
@@ -1233,29 +1282,29 @@ class Beosztas(models.Model):
             ).first()
             
             if absence:
-                print(f"[DEBUG] Found auto-generated absence #{absence.id}, updating...")
+                logger.debug(f"Found auto-generated absence #{absence.id}, updating...")
                 # Update with new timing from forgatas
                 absence.date = self.forgatas.date
                 absence.timeFrom = self.forgatas.timeFrom
                 absence.timeTo = self.forgatas.timeTo
                 absence.save()
-                print(f"[SUCCESS] Updated absence #{absence.id} for {user.get_full_name()}")
+                logger.info(f"Updated absence #{absence.id} for {user.get_full_name()}")
             else:
-                print(f"[DEBUG] No auto-generated absence found for {user.get_full_name()}, creating new one")
+                logger.debug(f"No auto-generated absence found for {user.get_full_name()}, creating new one")
                 # If absence doesn't exist, create it
                 self.create_absence_for_user(user)
         except Exception as e:
-            print(f"[ERROR] Failed to update absence for {user.get_full_name()}: {e}")
+            logger.error(f"Failed to update absence for {user.get_full_name()}: {e}")
             # Try to create if update fails
             self.create_absence_for_user(user)
     
     def remove_absence_for_user(self, user):
         """Remove absence record for a user no longer assigned to this forgatas"""
         if not self.forgatas:
-            print(f"[DEBUG] Cannot remove absence - no forgatas")
+            logger.debug("Cannot remove absence - no forgatas")
             return
         
-        print(f"[DEBUG] remove_absence_for_user called for user: {user.get_full_name()}")
+        logger.debug(f"remove_absence_for_user called for user: {user.get_full_name()}")
         
         # Only remove auto-generated absence records
         deleted_count, _ = Absence.objects.filter(
@@ -1265,23 +1314,23 @@ class Beosztas(models.Model):
         ).delete()
         
         if deleted_count > 0:
-            print(f"[SUCCESS] Removed {deleted_count} auto-generated absence(s) for {user.get_full_name()}")
+            logger.info(f"Removed {deleted_count} auto-generated absence(s) for {user.get_full_name()}")
         else:
-            print(f"[DEBUG] No auto-generated absences found to remove for {user.get_full_name()}")
+            logger.debug(f"No auto-generated absences found to remove for {user.get_full_name()}")
     
     def clean_absence_records(self):
         """Remove all auto-generated absence records associated with this assignment"""
-        print(f"[DEBUG] clean_absence_records called for Beosztas {self.id}")
+        logger.debug(f"clean_absence_records called for Beosztas {self.id}")
         
         if self.forgatas:
-            print(f"[DEBUG] Cleaning absences for forgatas: {self.forgatas.name}")
+            logger.debug(f"Cleaning absences for forgatas: {self.forgatas.name}")
             
             # Get users currently in assignment
             users_in_assignment = set()
             for relacio in self.szerepkor_relaciok.all():
                 users_in_assignment.add(relacio.user)
             
-            print(f"[DEBUG] Users in assignment: {[u.get_full_name() for u in users_in_assignment]}")
+            logger.debug(f"Users in assignment: {len(users_in_assignment)}")
             
             if users_in_assignment:
                 # Only remove auto-generated absences for users in this assignment
@@ -1298,11 +1347,11 @@ class Beosztas(models.Model):
                 ).delete()
             
             if deleted_count > 0:
-                print(f"[SUCCESS] Cleaned {deleted_count} auto-generated absences")
+                logger.info(f"Cleaned {deleted_count} auto-generated absences")
             else:
-                print(f"[DEBUG] No auto-generated absences found to clean")
+                logger.debug("No auto-generated absences found to clean")
         else:
-            print(f"[DEBUG] No forgatas to clean absences for")
+            logger.debug("No forgatas to clean absences for")
     
     def get_assigned_users(self):
         """Get all users assigned to roles in this assignment"""
@@ -1317,11 +1366,11 @@ class Beosztas(models.Model):
         from django.db import transaction
         
         with transaction.atomic():
-            print(f"[DEBUG] sync_all_absence_records started")
+            logger.debug("sync_all_absence_records started")
             
             # Get all assignments with forgatas (regardless of kesz status)
             assignments_with_forgatas = cls.objects.filter(forgatas__isnull=False)
-            print(f"[DEBUG] Found {assignments_with_forgatas.count()} assignments with forgatas")
+            logger.debug(f"Found {assignments_with_forgatas.count()} assignments with forgatas")
             
             # Delete existing auto-generated absence records for these forgatások
             forgatas_ids = [a.forgatas.id for a in assignments_with_forgatas]
@@ -1329,23 +1378,28 @@ class Beosztas(models.Model):
                 forgatas_id__in=forgatas_ids, 
                 auto_generated=True
             ).delete()[0]
-            print(f"[DEBUG] Deleted {deleted_count} existing auto-generated absences")
+            logger.debug(f"Deleted {deleted_count} existing auto-generated absences")
             
             # Recreate absence records for all current assignments
             created_count = 0
             for beosztas in assignments_with_forgatas:
-                print(f"[DEBUG] Processing beosztas {beosztas.id}")
+                logger.debug(f"Processing beosztas {beosztas.id}")
                 for user in beosztas.get_assigned_users():
                     beosztas.create_absence_for_user(user)
                     created_count += 1
             
-            print(f"[SUCCESS] sync_all_absence_records completed: deleted {deleted_count}, created {created_count}")
+            logger.info(f"sync_all_absence_records completed: deleted {deleted_count}, created {created_count}")
             return {'deleted': deleted_count, 'created': created_count}
     
     class Meta:
         verbose_name = "Beosztás"
         verbose_name_plural = "Beosztások"
         ordering = ['-created_at']
+        indexes = [
+            # Assignment list filters (kesz, stab) ordered by creation time
+            models.Index(fields=['kesz', '-created_at'], name='beosztas_kesz_created_idx'),
+            models.Index(fields=['stab', 'kesz', '-created_at'], name='beosztas_stab_kesz_created_idx'),
+        ]
 
 class SzerepkorRelaciok(models.Model):
     user = models.ForeignKey('auth.User', on_delete=models.CASCADE, verbose_name='Felhasználó', 
@@ -1410,38 +1464,38 @@ def handle_beosztas_szerepkor_change(sender, instance, action, pk_set, **kwargs)
     Automatically manage absence records when role assignments change
     Works for both draft and finalized assignments
     """
-    print(f"[DEBUG] M2M signal handler called: action={action}, instance={instance.id}")
+    logger.debug(f"M2M signal handler called: action={action}, instance={instance.id}")
     
     if not instance.forgatas:
-        print(f"[DEBUG] No forgatas, skipping absence management")
+        logger.debug("No forgatas, skipping absence management")
         return
     
     if action == 'post_add':
-        print(f"[DEBUG] M2M post_add: {len(pk_set)} relations added")
+        logger.debug(f"M2M post_add: {len(pk_set)} relations added")
         # New role relations added - create absence records for new users
         for relacio_pk in pk_set:
             try:
                 relacio = SzerepkorRelaciok.objects.get(pk=relacio_pk)
-                print(f"[DEBUG] Creating absence for added user: {relacio.user.get_full_name()}")
+                logger.debug(f"Creating absence for added user: {relacio.user.get_full_name()}")
                 instance.create_absence_for_user(relacio.user)
             except SzerepkorRelaciok.DoesNotExist:
-                print(f"[WARNING] SzerepkorRelaciok with pk {relacio_pk} not found")
+                logger.warning(f"SzerepkorRelaciok with pk {relacio_pk} not found")
                 pass
                 
     elif action == 'post_remove':
-        print(f"[DEBUG] M2M post_remove: {len(pk_set)} relations removed")
+        logger.debug(f"M2M post_remove: {len(pk_set)} relations removed")
         # Role relations removed - delete absence records for removed users
         for relacio_pk in pk_set:
             try:
                 relacio = SzerepkorRelaciok.objects.get(pk=relacio_pk)
-                print(f"[DEBUG] Removing absence for removed user: {relacio.user.get_full_name()}")
+                logger.debug(f"Removing absence for removed user: {relacio.user.get_full_name()}")
                 instance.remove_absence_for_user(relacio.user)
             except SzerepkorRelaciok.DoesNotExist:
-                print(f"[WARNING] SzerepkorRelaciok with pk {relacio_pk} not found")
+                logger.warning(f"SzerepkorRelaciok with pk {relacio_pk} not found")
                 pass
                 
     elif action == 'post_clear':
-        print(f"[DEBUG] M2M post_clear: clearing all absences")
+        logger.debug("M2M post_clear: clearing all absences")
         # All role relations cleared - remove all related absence records
         instance.clean_absence_records()
 
@@ -1463,11 +1517,11 @@ def capture_users_before_assignment_removal(sender, instance, action, pk_set, **
     Capture user information before assignment removal to enable email notifications.
     """
     if action == 'pre_remove' and pk_set and instance.forgatas:
-        print(f"[DEBUG] Capturing users before removal from assignment {instance.id}")
+        logger.debug(f"Capturing users before removal from assignment {instance.id}")
         
         # Skip email notifications for KaCsa type forgatások
         if instance.forgatas.forgTipus == 'kacsa':
-            print(f"[DEBUG] Skipping email capture for KaCsa type forgatas: {instance.forgatas.name}")
+            logger.debug(f"Skipping email capture for KaCsa type forgatas: {instance.forgatas.name}")
             return
         
         try:
@@ -1477,10 +1531,10 @@ def capture_users_before_assignment_removal(sender, instance, action, pk_set, **
             
             # Store in temporary storage
             _assignment_removal_users[instance.id] = removed_users
-            print(f"[DEBUG] Captured {len(removed_users)} users for removal from assignment {instance.id}")
+            logger.debug(f"Captured {len(removed_users)} users for removal from assignment {instance.id}")
             
         except Exception as e:
-            print(f"[ERROR] Failed to capture users before assignment removal: {str(e)}")
+            logger.error(f"Failed to capture users before assignment removal: {str(e)}")
 
 
 @receiver(post_save, sender=Announcement)
@@ -1489,8 +1543,8 @@ def send_announcement_email(sender, instance, created, **kwargs):
     Send email notification when an announcement is created or updated.
     """
     if created:
-        print(f"[DEBUG] ========== ANNOUNCEMENT CREATED SIGNAL ==========")
-        print(f"[DEBUG] New announcement created: {instance.title}")
+        logger.debug("========== ANNOUNCEMENT CREATED SIGNAL ==========")
+        logger.debug(f"New announcement created: {instance.title}")
         
         try:
             # Import email function
@@ -1501,27 +1555,25 @@ def send_announcement_email(sender, instance, created, **kwargs):
             if instance.cimzettek.exists():
                 # Targeted announcement - notify specific recipients
                 recipients = list(instance.cimzettek.filter(is_active=True))
-                print(f"[DEBUG] Targeted announcement - {len(recipients)} specific recipients")
+                logger.debug(f"Targeted announcement - {len(recipients)} specific recipients")
             else:
                 # Global announcement - notify all active users
                 recipients = list(User.objects.filter(is_active=True))
-                print(f"[DEBUG] Global announcement - {len(recipients)} active users")
+                logger.debug(f"Global announcement - {len(recipients)} active users")
             
             if recipients:
-                print(f"[DEBUG] Sending announcement email to {len(recipients)} recipients")
+                logger.debug(f"Sending announcement email to {len(recipients)} recipients")
                 email_sent = send_announcement_notification_email(instance, recipients)
                 
                 if email_sent:
-                    print(f"[SUCCESS] Announcement email sent successfully: {instance.title}")
+                    logger.info(f"Announcement email sent successfully: {instance.title}")
                 else:
-                    print(f"[WARNING] Failed to send announcement email: {instance.title}")
+                    logger.warning(f"Failed to send announcement email: {instance.title}")
             else:
-                print(f"[DEBUG] No recipients found for announcement email")
+                logger.debug("No recipients found for announcement email")
                 
         except Exception as e:
-            print(f"[ERROR] Announcement email signal failed: {str(e)}")
-            import traceback
-            print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+            logger.exception(f"Announcement email signal failed: {str(e)}")
 
 
 @receiver(m2m_changed, sender=Announcement.cimzettek.through)
@@ -1530,8 +1582,8 @@ def announcement_recipients_changed(sender, instance, action, pk_set, **kwargs):
     Send email notification when announcement recipients are changed after creation.
     """
     if action == 'post_add' and pk_set:
-        print(f"[DEBUG] ========== ANNOUNCEMENT RECIPIENTS CHANGED ==========")
-        print(f"[DEBUG] Recipients added to announcement: {instance.title}")
+        logger.debug("========== ANNOUNCEMENT RECIPIENTS CHANGED ==========")
+        logger.debug(f"Recipients added to announcement: {instance.title}")
         
         try:
             # Import email function
@@ -1541,20 +1593,18 @@ def announcement_recipients_changed(sender, instance, action, pk_set, **kwargs):
             new_recipients = list(User.objects.filter(id__in=pk_set, is_active=True))
             
             if new_recipients:
-                print(f"[DEBUG] Sending announcement email to {len(new_recipients)} new recipients")
+                logger.debug(f"Sending announcement email to {len(new_recipients)} new recipients")
                 email_sent = send_announcement_notification_email(instance, new_recipients)
                 
                 if email_sent:
-                    print(f"[SUCCESS] Announcement email sent to new recipients: {instance.title}")
+                    logger.info(f"Announcement email sent to new recipients: {instance.title}")
                 else:
-                    print(f"[WARNING] Failed to send announcement email to new recipients: {instance.title}")
+                    logger.warning(f"Failed to send announcement email to new recipients: {instance.title}")
             else:
-                print(f"[DEBUG] No new active recipients found")
+                logger.debug("No new active recipients found")
                 
         except Exception as e:
-            print(f"[ERROR] Announcement recipients change email signal failed: {str(e)}")
-            import traceback
-            print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+            logger.exception(f"Announcement recipients change email signal failed: {str(e)}")
 
 
 # Storage for tracking old beosztas state before save
@@ -1580,16 +1630,16 @@ def send_assignment_email(sender, instance, created, **kwargs):
     Send email notification when an assignment is created or updated.
     Specifically sends 'Beosztás véglegesítve' email when status changes from Piszkozat to Kész.
     """
-    print(f"[DEBUG] ========== ASSIGNMENT SAVED SIGNAL ==========")
-    print(f"[DEBUG] Assignment saved - Created: {created}, ID: {instance.id}")
+    logger.debug("========== ASSIGNMENT SAVED SIGNAL ==========")
+    logger.debug(f"Assignment saved - Created: {created}, ID: {instance.id}")
     
     if not instance.forgatas:
-        print(f"[DEBUG] No forgatas associated with assignment, skipping email")
+        logger.debug("No forgatas associated with assignment, skipping email")
         return
     
     # Skip email notifications for KaCsa type forgatások
     if instance.forgatas.forgTipus == 'kacsa':
-        print(f"[DEBUG] Skipping email notification for KaCsa type forgatas: {instance.forgatas.name}")
+        logger.debug(f"Skipping email notification for KaCsa type forgatas: {instance.forgatas.name}")
         return
     
     try:
@@ -1607,7 +1657,7 @@ def send_assignment_email(sender, instance, created, **kwargs):
         for relation in instance.szerepkor_relaciok.all():
             current_users.append(relation.user)
         
-        print(f"[DEBUG] Current assigned users: {len(current_users)}")
+        logger.debug(f"Current assigned users: {len(current_users)}")
         
         # Check if status changed from Piszkozat (False) to Kész (True)
         old_state = _beosztas_old_state.get(instance.pk, {})
@@ -1619,7 +1669,7 @@ def send_assignment_email(sender, instance, created, **kwargs):
         
         if status_changed_to_kesz:
             # Status changed from Piszkozat to Kész - send finalization email
-            print(f"[DEBUG] *** Beosztás status changed from Piszkozat to Kész - sending finalization email ***")
+            logger.debug("*** Beosztás status changed from Piszkozat to Kész - sending finalization email ***")
             
             if current_users:
                 # Collect valid email addresses
@@ -1627,9 +1677,9 @@ def send_assignment_email(sender, instance, created, **kwargs):
                 for user in current_users:
                     if user.email and user.is_active:
                         recipient_emails.append(user.email)
-                        print(f"[DEBUG] - Will notify: {user.get_full_name()} ({user.email})")
+                        logger.debug(f"- Will notify: {user.get_full_name()} ({user.email})")
                     else:
-                        print(f"[DEBUG] - Skipped (no email or inactive): {user.get_full_name()}")
+                        logger.debug(f"- Skipped (no email or inactive): {user.get_full_name()}")
                 
                 if recipient_emails:
                     subject = f"FTV - Beosztás véglegesítve: {instance.forgatas.name}"
@@ -1682,16 +1732,16 @@ Ha bármilyen kérdése van, kérjük vegye fel a kapcsolatot a kapcsolattartóv
                     )
                     
                     if successful_count > 0:
-                        print(f"[SUCCESS] Beosztás véglegesítve email sent to {successful_count} users: {instance.forgatas.name}")
+                        logger.info(f"Beosztás véglegesítve email sent to {successful_count} users: {instance.forgatas.name}")
                     if failed_emails:
-                        print(f"[WARNING] Failed to send finalization email to: {failed_emails}")
+                        logger.warning(f"Failed to send finalization email to: {failed_emails}")
                 else:
-                    print(f"[DEBUG] No valid email addresses for assigned users")
+                    logger.debug("No valid email addresses for assigned users")
             else:
-                print(f"[DEBUG] No users assigned to finalized assignment")
+                logger.debug("No users assigned to finalized assignment")
         elif created:
             # New assignment - notify all assigned users
-            print(f"[DEBUG] New assignment created, notifying all assigned users")
+            logger.debug("New assignment created, notifying all assigned users")
             
             if current_users:
                 email_sent = send_assignment_change_notification_email(
@@ -1701,22 +1751,20 @@ Ha bármilyen kérdése van, kérjük vegye fel a kapcsolatot a kapcsolattartóv
                 )
                 
                 if email_sent:
-                    print(f"[SUCCESS] Assignment creation email sent: {instance.forgatas.name}")
+                    logger.info(f"Assignment creation email sent: {instance.forgatas.name}")
                 else:
-                    print(f"[WARNING] Failed to send assignment creation email: {instance.forgatas.name}")
+                    logger.warning(f"Failed to send assignment creation email: {instance.forgatas.name}")
             else:
-                print(f"[DEBUG] No users assigned to new assignment")
+                logger.debug("No users assigned to new assignment")
         else:
-            print(f"[DEBUG] Assignment updated but status not changed to Kész, no email sent")
+            logger.debug("Assignment updated but status not changed to Kész, no email sent")
         
         # Clean up old state tracking
         if instance.pk in _beosztas_old_state:
             del _beosztas_old_state[instance.pk]
                 
     except Exception as e:
-        print(f"[ERROR] Assignment email signal failed: {str(e)}")
-        import traceback
-        print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+        logger.exception(f"Assignment email signal failed: {str(e)}")
 
 
 @receiver(m2m_changed, sender=Beosztas.szerepkor_relaciok.through)
@@ -1725,12 +1773,12 @@ def assignment_users_changed(sender, instance, action, pk_set, **kwargs):
     Send email notification when assignment users are changed.
     """
     if action in ['post_add', 'post_remove'] and pk_set and instance.forgatas:
-        print(f"[DEBUG] ========== ASSIGNMENT USERS CHANGED ==========")
-        print(f"[DEBUG] Assignment users changed - Action: {action}, Assignment ID: {instance.id}")
+        logger.debug("========== ASSIGNMENT USERS CHANGED ==========")
+        logger.debug(f"Assignment users changed - Action: {action}, Assignment ID: {instance.id}")
         
         # Skip email notifications for KaCsa type forgatások
         if instance.forgatas.forgTipus == 'kacsa':
-            print(f"[DEBUG] Skipping email notification for KaCsa type forgatas: {instance.forgatas.name}")
+            logger.debug(f"Skipping email notification for KaCsa type forgatas: {instance.forgatas.name}")
             return
         
         try:
@@ -1742,7 +1790,7 @@ def assignment_users_changed(sender, instance, action, pk_set, **kwargs):
                 added_relations = SzerepkorRelaciok.objects.filter(id__in=pk_set)
                 added_users = [rel.user for rel in added_relations]
                 
-                print(f"[DEBUG] Users added to assignment: {len(added_users)}")
+                logger.debug(f"Users added to assignment: {len(added_users)}")
                 
                 if added_users:
                     email_sent = send_assignment_change_notification_email(
@@ -1752,9 +1800,9 @@ def assignment_users_changed(sender, instance, action, pk_set, **kwargs):
                     )
                     
                     if email_sent:
-                        print(f"[SUCCESS] Assignment addition email sent: {instance.forgatas.name}")
+                        logger.info(f"Assignment addition email sent: {instance.forgatas.name}")
                     else:
-                        print(f"[WARNING] Failed to send assignment addition email: {instance.forgatas.name}")
+                        logger.warning(f"Failed to send assignment addition email: {instance.forgatas.name}")
                         
             elif action == 'post_remove':
                 # Users removed from assignment
@@ -1762,7 +1810,7 @@ def assignment_users_changed(sender, instance, action, pk_set, **kwargs):
                 removed_users = _assignment_removal_users.get(instance.id, [])
                 
                 if removed_users:
-                    print(f"[DEBUG] Users removed from assignment: {len(removed_users)}")
+                    logger.debug(f"Users removed from assignment: {len(removed_users)}")
                     
                     email_sent = send_assignment_change_notification_email(
                         instance.forgatas,
@@ -1771,19 +1819,17 @@ def assignment_users_changed(sender, instance, action, pk_set, **kwargs):
                     )
                     
                     if email_sent:
-                        print(f"[SUCCESS] Assignment removal email sent: {instance.forgatas.name}")
+                        logger.info(f"Assignment removal email sent: {instance.forgatas.name}")
                     else:
-                        print(f"[WARNING] Failed to send assignment removal email: {instance.forgatas.name}")
+                        logger.warning(f"Failed to send assignment removal email: {instance.forgatas.name}")
                     
                     # Clean up temporary storage
                     del _assignment_removal_users[instance.id]
                 else:
-                    print(f"[DEBUG] No users captured for removal from assignment {instance.id}")
+                    logger.debug(f"No users captured for removal from assignment {instance.id}")
                 
         except Exception as e:
-            print(f"[ERROR] Assignment users change email signal failed: {str(e)}")
-            import traceback
-            print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+            logger.exception(f"Assignment users change email signal failed: {str(e)}")
 
 
 @receiver(post_save, sender=Forgatas)
@@ -1793,8 +1839,8 @@ def send_forgatas_creation_email(sender, instance, created, **kwargs):
     Only triggers on creation, not on updates.
     """
     if created:
-        print(f"[DEBUG] ========== FORGATAS CREATED SIGNAL ==========")
-        print(f"[DEBUG] New forgatás created: {instance.name}")
+        logger.debug("========== FORGATAS CREATED SIGNAL ==========")
+        logger.debug(f"New forgatás created: {instance.name}")
         
         try:
             # Import email function
@@ -1818,25 +1864,23 @@ def send_forgatas_creation_email(sender, instance, created, **kwargs):
                     pass
             
             if not creator_user:
-                print(f"[WARNING] Could not determine creator for forgatás: {instance.name}")
+                logger.warning(f"Could not determine creator for forgatás: {instance.name}")
                 # Create a placeholder user for email purposes
                 from django.contrib.auth.models import User
                 creator_user = User(username='system', first_name='Rendszer', last_name='Felhasználó')
             
-            print(f"[DEBUG] Creator identified as: {creator_user.get_full_name() or creator_user.username}")
+            logger.debug(f"Creator identified as: {creator_user.get_full_name() or creator_user.username}")
             
             # Send email notification to all Médiatanár users
             email_sent = send_forgatas_creation_notification_email(instance, creator_user)
             
             if email_sent:
-                print(f"[SUCCESS] Forgatás creation email sent successfully: {instance.name}")
+                logger.info(f"Forgatás creation email sent successfully: {instance.name}")
             else:
-                print(f"[WARNING] Failed to send forgatás creation email: {instance.name}")
+                logger.warning(f"Failed to send forgatás creation email: {instance.name}")
                 
         except Exception as e:
-            print(f"[ERROR] Forgatás creation email signal failed: {str(e)}")
-            import traceback
-            print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+            logger.exception(f"Forgatás creation email signal failed: {str(e)}")
 
 
 class SystemMessage(models.Model):
@@ -25,6 +25,7 @@ Classes:
 - GET  /classes/{id}           - Get specific class details
 - GET  /classes/by-section/{section} - Get classes by section (A, B, F, etc.)
 - POST /classes                - Create new class (admin only)
+- POST /classes/bulk           - Create multiple classes at once (admin only)
 - PUT  /classes/{id}          - Update class (admin only)
 - DELETE /classes/{id}        - Delete class (admin only)
 
@@ -152,17 +153,24 @@ School Years:
 - Automatic year calculation from dates
 
 Classes:
-- Section must be single character
+- Section must be a single letter (A-Z)
 - Start year must be valid calendar year
 - Optional school year reference must exist
 - Student assignments prevent deletion
 """
 
 from ninja import Schema
+from django.db import transaction
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
 from api.models import Tanev, Osztaly, Profile
 from .auth import JWTAuth, ErrorSchema
 from datetime import date, datetime
 from typing import Optional
+import hashlib
+import string
 
 # ============================================================================
 # Schemas
@@ -181,8 +189,8 @@ class TanevSchema(Schema):
 
 class TanevCreateSchema(Schema):
     """Request schema for creating new school year."""
-    start_date: str
-    end_date: str
+    start_date: date
+    end_date: date
 
 class TanevForDateSchema(Schema):
     """Response schema for school year lookup by date."""
@@ -242,81 +250,204 @@ class ClassTeacherAssignSchema(Schema):
 # Utility Functions
 # ============================================================================
 
-def create_tanev_response(tanev: Tanev) -> dict:
+# Érvényes szekciók: egyetlen nagybetű (a bemenetet előbb nagybetűsítjük)
+_VALID_SZEKCIOK = frozenset(string.ascii_uppercase)
+
+def get_tanev_queryset():
+    """
+    School year queryset with the class count annotated.
+    
+    create_tanev_response reads ``osztaly_count`` from the annotation, so
+    listing school years does not issue a COUNT query per row. The count is
+    a correlated subquery rather than Count('osztalyok'): this queryset is
+    also used to prefetch Osztaly.tanevek, and the prefetch filter would
+    reuse the osztalyok join and count only the prefetching class.
+    """
+    TanevOsztaly = Tanev.osztalyok.through
+    osztaly_count = TanevOsztaly.objects.filter(tanev_id=OuterRef('pk')).order_by().values(
+        'tanev_id'
+    ).annotate(count=Count('osztaly_id')).values('count')
+    return Tanev.objects.annotate(osztaly_count=Coalesce(Subquery(osztaly_count), 0))
+
+def get_osztaly_queryset():
     """
-    Create standardized school year response dictionary.
+    Class queryset with everything create_osztaly_response needs.
+    
+    The student count is annotated and the school years (with their own
+    class counts) are prefetched in one extra query, so the number of
+    queries does not grow with the number of classes.
+    """
+    return Osztaly.objects.annotate(student_count=Count('profile')).prefetch_related(
+        Prefetch('tanevek', queryset=get_tanev_queryset())
+    )
+
+# Jelzőérték: az aktív tanév még nincs lekérdezve (a None érvényes érték,
+# azt jelenti, hogy nincs aktív tanév).
+_ACTIVE_TANEV_NOT_LOADED = object()
+
+def create_tanev_response(tanev: Tanev, active_tanev=_ACTIVE_TANEV_NOT_LOADED) -> TanevSchema:
+    """
+    Create standardized school year response.
+    
+    The schema is built with ``model_construct`` (no validation): the data
+    comes straight from the database, so Ninja can serialize it without an
+    intermediate dict being validated again.
     
     Args:
         tanev: Tanev model instance
+        active_tanev: Currently active Tanev (or None); looked up if not given.
+            List endpoints pass it in so it is resolved once per request.
         
     Returns:
-        Dictionary with school year information
+        TanevSchema with school year information
     """
-    active_tanev = Tanev.get_active()
+    if active_tanev is _ACTIVE_TANEV_NOT_LOADED:
+        active_tanev = Tanev.get_active()
     is_active = active_tanev is not None and active_tanev.id == tanev.id
     
+    return TanevSchema.model_construct(
+        id=tanev.id,
+        start_date=tanev.start_date.isoformat(),
+        end_date=tanev.end_date.isoformat(),
+        start_year=tanev.start_year,
+        end_year=tanev.end_year,
+        display_name=str(tanev),
+        is_active=is_active,
+        osztaly_count=tanev.osztaly_count if hasattr(tanev, 'osztaly_count') else tanev.osztalyok.count()
+    )
+
+def create_tanev_row_response(row: dict, active_tanev) -> dict:
+    """
+    Create school year response from a ``get_tanev_queryset().values()`` row.
+    
+    Used by the school year list: no Tanev instance is built per row. The
+    fields are the same as in create_tanev_response.
+    
+    Args:
+        row: Dict with id, start_date, end_date and osztaly_count
+        active_tanev: Currently active Tanev (or None)
+        
+    Returns:
+        Dict matching TanevSchema
+    """
+    start_date = row['start_date']
+    end_date = row['end_date']
     return {
-        "id": tanev.id,
-        "start_date": tanev.start_date.isoformat(),
-        "end_date": tanev.end_date.isoformat(),
-        "start_year": tanev.start_year,
-        "end_year": tanev.end_year,
-        "display_name": str(tanev),
-        "is_active": is_active,
-        "osztaly_count": tanev.osztalyok.count()
+        "id": row['id'],
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "start_year": start_date.year,
+        "end_year": end_date.year,
+        "display_name": f"{start_date.year}/{end_date.year}",
+        "is_active": active_tanev is not None and active_tanev.id == row['id'],
+        "osztaly_count": row['osztaly_count']
     }
 
-def create_osztaly_response(osztaly: Osztaly) -> dict:
+def create_osztaly_response(osztaly: Osztaly, active_tanev=_ACTIVE_TANEV_NOT_LOADED,
+                            tanev_responses: Optional[dict] = None) -> OsztalySchema:
     """
-    Create standardized class response dictionary.
+    Create standardized class response (built without validation, see
+    create_tanev_response).
     
     Args:
         osztaly: Osztaly model instance
+        active_tanev: Currently active Tanev (or None); looked up if not given.
+            List endpoints pass it in so it is resolved once per request.
+        tanev_responses: Optional per-request dict (tanev id -> TanevSchema).
+            List endpoints pass an empty dict so each school year's response
+            is built once, not once per class that belongs to it.
         
     Returns:
-        Dictionary with class information
+        OsztalySchema with class information
     """
+    if active_tanev is _ACTIVE_TANEV_NOT_LOADED:
+        active_tanev = Tanev.get_active()
+    
     # A tanév információt a Tanev.osztalyok M2M-en keresztül számoljuk. Több
     # tanév is tartozhat egy osztályhoz (különböző évfolyamokban), így a
     # frontend külön kezelheti őket. A `tanev` mező a legutóbbi tanévet adja
     # vissza visszamenőleges kompatibilitás miatt.
-    tanevek_qs = osztaly.tanevek.all().order_by('-start_date')
-    tanevek = [create_tanev_response(t) for t in tanevek_qs]
-    return {
-        "id": osztaly.id,
-        "start_year": osztaly.startYear,
-        "szekcio": osztaly.szekcio,
-        "display_name": str(osztaly),
-        "current_display_name": osztaly.get_current_year_name() if hasattr(osztaly, 'get_current_year_name') else str(osztaly),
-        "tanev": tanevek[0] if tanevek else None,
-        "tanevek": tanevek,
-        "student_count": osztaly.profile_set.count() if hasattr(osztaly, 'profile_set') else 0
-    }
-
-def create_osztaly_with_teachers_response(osztaly: Osztaly) -> dict:
+    # A Tanev alapértelmezett rendezése '-start_date', így az .all() a
+    # prefetch-elt (get_osztaly_queryset) listát adja vissza újabb lekérdezés
+    # nélkül, a legutóbbi tanévvel kezdve.
+    if tanev_responses is None:
+        tanevek = [create_tanev_response(t, active_tanev) for t in osztaly.tanevek.all()]
+    else:
+        tanevek = []
+        for t in osztaly.tanevek.all():
+            tanev_response = tanev_responses.get(t.id)
+            if tanev_response is None:
+                tanev_response = tanev_responses[t.id] = create_tanev_response(t, active_tanev)
+            tanevek.append(tanev_response)
+    
+    # A megjelenített név (str(osztaly)) és az aktuális évfolyamnév ugyanaz az
+    # érték: az aktív tanévhez viszonyított név. Soronként egyszer számoljuk.
+    display_name = osztaly.get_year_name_for_tanev(active_tanev)
+    return OsztalySchema.model_construct(
+        id=osztaly.id,
+        start_year=osztaly.startYear,
+        szekcio=osztaly.szekcio,
+        display_name=display_name,
+        current_display_name=display_name,
+        tanev=tanevek[0] if tanevek else None,
+        tanevek=tanevek,
+        student_count=osztaly.student_count if hasattr(osztaly, 'student_count') else osztaly.profile_set.count()
+    )
+
+def create_osztaly_with_teachers_response(osztaly: Osztaly) -> OsztalyWithTeachersSchema:
     """
-    Create standardized class response dictionary including teacher information.
+    Create standardized class response including teacher information.
     
     Args:
         osztaly: Osztaly model instance
         
     Returns:
-        Dictionary with class information including teachers
+        OsztalyWithTeachersSchema with class information including teachers
     """
     # Get class teachers
     teachers = []
     for i, teacher_user in enumerate(osztaly.get_osztaly_fonokei()):
-        teachers.append({
-            "user_id": teacher_user.id,
-            "username": teacher_user.username,
-            "full_name": teacher_user.get_full_name(),
-            "email": teacher_user.email,
-            "is_main_teacher": i == 0  # First teacher is considered main teacher
-        })
+        teachers.append(OsztalyTeacherSchema.model_construct(
+            user_id=teacher_user.id,
+            username=teacher_user.username,
+            full_name=teacher_user.get_full_name(),
+            email=teacher_user.email,
+            is_main_teacher=i == 0  # First teacher is considered main teacher
+        ))
     
     base_response = create_osztaly_response(osztaly)
-    base_response["teachers"] = teachers
-    return base_response
+    return OsztalyWithTeachersSchema.model_construct(
+        **dict(base_response),
+        teachers=teachers
+    )
+
+def rows_etag(rows, *extra) -> str:
+    """
+    Strong ETag for a list response, computed from the rows it is built from.
+    
+    Args:
+        rows: The ``values()`` rows the response is built from
+        extra: Any other input of the response (e.g. the active school year id)
+        
+    Returns:
+        Quoted ETag string
+    """
+    digest = hashlib.md5(repr((rows, extra)).encode(), usedforsecurity=False).hexdigest()
+    return quote_etag(digest)
+
+def not_modified_response(request, etag: str) -> Optional[HttpResponseNotModified]:
+    """
+    304 response if the client's If-None-Match header matches ``etag``.
+    
+    Returns:
+        HttpResponseNotModified carrying the ETag, or None if the client has
+        no (or an outdated) copy and the full response has to be built.
+    """
+    if etag not in parse_etags(request.headers.get('If-None-Match', '')):
+        return None
+    response = HttpResponseNotModified()
+    response['ETag'] = etag
+    return response
 
 def check_admin_permissions(user) -> tuple[bool, str]:
     """
@@ -329,8 +460,8 @@ def check_admin_permissions(user) -> tuple[bool, str]:
         Tuple of (has_permission, error_message)
     """
     try:
-        from api.models import Profile
-        profile = Profile.objects.get(user=user)
+        # request.auth profile-ja a JWTAuth-ban már be van töltve
+        profile = user.profile
         if not profile.has_admin_permission('any'):
             return False, "Adminisztrátor jogosultság szükséges"
         return True, ""
@@ -349,27 +480,51 @@ def register_academic_endpoints(api):
     # ========================================================================
     
     @api.get("/school-years", auth=JWTAuth(), response={200: list[TanevSchema], 401: ErrorSchema})
-    def get_school_years(request):
+    def get_school_years(request, response: HttpResponse):
         """
         Get all school years.
         
         Requires authentication. Returns all school years with their
-        basic information and class counts.
+        basic information and class counts. The response carries an ETag;
+        a request with a matching If-None-Match header gets 304 without
+        the list being rebuilt.
         
         Returns:
             200: List of all school years
+            304: Not modified since the client's copy
             401: Authentication failed
         """
-        try:
-            school_years = Tanev.objects.prefetch_related('osztalyok').all()
-            
-            response = []
-            for tanev in school_years:
-                response.append(create_tanev_response(tanev))
-            
-            return 200, response
-        except Exception as e:
-            return 401, {"message": f"Error fetching school years: {str(e)}"}
+        # A tanévek száma kicsi, a sorokat egyszer betöltjük: ebből számoljuk
+        # az ETag-et és (ha kell) a választ is.
+        rows = list(get_tanev_queryset().values('id', 'start_date', 'end_date', 'osztaly_count'))
+        active_tanev = Tanev.get_active()
+        
+        etag = rows_etag(rows, active_tanev.id if active_tanev else None)
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+        response['ETag'] = etag
+        
+        return 200, [create_tanev_row_response(row, active_tanev) for row in rows]
+
+    # Needs to be registered before /school-years/{tanev_id}, otherwise "active"
+    # would be matched as a tanev_id path parameter and rejected with 422.
+    @api.get("/school-years/active", auth=JWTAuth(), response={200: TanevSchema, 401: ErrorSchema, 404: ErrorSchema})
+    def get_active_school_year(request):
+        """
+        Get currently active school year.
+        
+        Requires authentication. Returns the school year that contains today's date.
+        
+        Returns:
+            200: Active school year details
+            404: No active school year found
+            401: Authentication failed
+        """
+        active_tanev = Tanev.get_active()
+        if not active_tanev:
+            return 404, {"message": "Nincs aktív tanév"}
+        return 200, create_tanev_response(active_tanev, active_tanev)
 
     @api.get("/school-years/{tanev_id}", auth=JWTAuth(), response={200: TanevSchema, 401: ErrorSchema, 404: ErrorSchema})
     def get_school_year(request, tanev_id: int):
@@ -387,32 +542,10 @@ def register_academic_endpoints(api):
             401: Authentication failed
         """
         try:
-            tanev = Tanev.objects.prefetch_related('osztalyok').get(id=tanev_id)
+            tanev = get_tanev_queryset().get(id=tanev_id)
             return 200, create_tanev_response(tanev)
         except Tanev.DoesNotExist:
             return 404, {"message": "Tanév nem található"}
-        except Exception as e:
-            return 401, {"message": f"Error fetching school year: {str(e)}"}
-
-    @api.get("/school-years/active", auth=JWTAuth(), response={200: TanevSchema, 401: ErrorSchema, 404: ErrorSchema})
-    def get_active_school_year(request):
-        """
-        Get currently active school year.
-        
-        Requires authentication. Returns the school year that contains today's date.
-        
-        Returns:
-            200: Active school year details
-            404: No active school year found
-            401: Authentication failed
-        """
-        try:
-            active_tanev = Tanev.get_active()
-            if not active_tanev:
-                return 404, {"message": "Nincs aktív tanév"}
-            return 200, create_tanev_response(active_tanev)
-        except Exception as e:
-            return 401, {"message": f"Error fetching active school year: {str(e)}"}
 
     @api.get("/school-years/for-date/{date}", auth=JWTAuth(), response={200: TanevForDateSchema, 401: ErrorSchema, 404: ErrorSchema})
     def get_school_year_for_date(request, date: str):
@@ -467,8 +600,9 @@ def register_academic_endpoints(api):
             
         Returns:
             201: School year created successfully
-            400: Invalid data or date validation failed
+            400: End date is not after start date
             401: Authentication or permission failed
+            422: Dates are not valid ISO dates (YYYY-MM-DD)
         """
         try:
             # Check if user has admin permissions
@@ -476,19 +610,13 @@ def register_academic_endpoints(api):
             if not has_permission:
                 return 401, {"message": error_message}
             
-            # Validate dates
-            try:
-                start_date = datetime.fromisoformat(data.start_date).date()
-                end_date = datetime.fromisoformat(data.end_date).date()
-            except ValueError:
-                return 400, {"message": "Hibás dátum formátum"}
-            
-            if start_date >= end_date:
+            # A dátumok formátumát már a séma ellenőrzi (hibás formátum: 422)
+            if data.start_date >= data.end_date:
                 return 400, {"message": "A záró dátumnak a kezdő dátum után kell lennie"}
             
             tanev = Tanev.objects.create(
-                start_date=start_date,
-                end_date=end_date
+                start_date=data.start_date,
+                end_date=data.end_date
             )
             
             return 201, create_tanev_response(tanev)
@@ -500,27 +628,111 @@ def register_academic_endpoints(api):
     # ========================================================================
     
     @api.get("/classes", auth=JWTAuth(), response={200: list[OsztalySchema], 401: ErrorSchema})
-    def get_classes(request):
+    def get_classes(request, response: HttpResponse):
         """
         Get all classes.
         
         Requires authentication. Returns all classes with their
-        basic information and student counts.
+        basic information and student counts. The response carries an ETag;
+        a request with a matching If-None-Match header gets 304 without
+        the list being serialized.
         
         Returns:
             200: List of all classes
+            304: Not modified since the client's copy
             401: Authentication failed
         """
+        # Az osztályokat (a tanévekkel együtt) egyszer betöltjük: ebből
+        # számoljuk az ETag-et és (ha kell) a választ is.
+        classes = list(get_osztaly_queryset())
+        active_tanev = Tanev.get_active()
+        
+        # Aktív tanév nélkül az évfolyamnév a mai dátumból számolódik
+        etag = rows_etag(
+            [
+                (osztaly.id, osztaly.startYear, osztaly.szekcio, osztaly.student_count,
+                 [(t.id, t.start_date, t.end_date, t.osztaly_count) for t in osztaly.tanevek.all()])
+                for osztaly in classes
+            ],
+            (active_tanev.id, active_tanev.start_date) if active_tanev else date.today()
+        )
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+        response['ETag'] = etag
+        
+        tanev_responses = {}
+        return 200, [
+            create_osztaly_response(osztaly, active_tanev, tanev_responses)
+            for osztaly in classes
+        ]
+
+    # Needs to be registered before /classes/{osztaly_id}, otherwise "bulk"
+    # would be matched as an osztaly_id path parameter.
+    @api.post("/classes/bulk", auth=JWTAuth(), response={201: list[OsztalySchema], 400: ErrorSchema, 401: ErrorSchema})
+    def create_classes_bulk(request, data: list[OsztalyCreateSchema]):
+        """
+        Create multiple classes in one request.
+        
+        Requires admin permissions. All items are validated first, then the
+        classes are created in a single transaction - either every class is
+        created or none of them.
+        
+        Args:
+            data: List of class creation data
+            
+        Returns:
+            201: Classes created successfully
+            400: Invalid data or validation failed
+            401: Authentication or permission failed
+        """
         try:
-            classes = Osztaly.objects.prefetch_related('tanevek').all()
+            # Check if user has admin permissions
+            has_permission, error_message = check_admin_permissions(request.auth)
+            if not has_permission:
+                return 401, {"message": error_message}
+            
+            if not data:
+                return 400, {"message": "Legalább egy osztály megadása szükséges"}
+            
+            # Validate sections (normalised once, reused for the insert)
+            szekciok = [item.szekcio.upper() for item in data]
+            for index, szekcio in enumerate(szekciok):
+                if szekcio not in _VALID_SZEKCIOK:
+                    return 400, {"message": f"A szekció egyetlen betű lehet (A-Z) (#{index + 1})"}
+            
+            # Validate all referenced school years with a single query
+            tanev_ids = {item.tanev_id for item in data if item.tanev_id}
+            if tanev_ids:
+                existing_ids = set(Tanev.objects.filter(id__in=tanev_ids).values_list('id', flat=True))
+                missing_ids = tanev_ids - existing_ids
+                if missing_ids:
+                    return 400, {"message": f"Tanév nem található: {', '.join(str(i) for i in sorted(missing_ids))}"}
             
-            response = []
-            for osztaly in classes:
-                response.append(create_osztaly_response(osztaly))
+            with transaction.atomic():
+                osztalyok = Osztaly.objects.bulk_create([
+                    Osztaly(startYear=item.start_year, szekcio=szekcio)
+                    for item, szekcio in zip(data, szekciok)
+                ])
+                
+                # Az osztály-tanév kapcsolatokat egyetlen INSERT-tel hozzuk létre
+                TanevOsztaly = Tanev.osztalyok.through
+                TanevOsztaly.objects.bulk_create([
+                    TanevOsztaly(tanev_id=item.tanev_id, osztaly_id=osztaly.id)
+                    for item, osztaly in zip(data, osztalyok)
+                    if item.tanev_id
+                ])
             
-            return 200, response
+            # Re-read with the response annotations, returned in request order
+            created = get_osztaly_queryset().in_bulk([osztaly.id for osztaly in osztalyok])
+            active_tanev = Tanev.get_active()
+            tanev_responses = {}
+            return 201, [
+                create_osztaly_response(created[osztaly.id], active_tanev, tanev_responses)
+                for osztaly in osztalyok
+            ]
         except Exception as e:
-            return 401, {"message": f"Error fetching classes: {str(e)}"}
+            return 400, {"message": f"Error creating classes: {str(e)}"}
 
     @api.get("/classes/{osztaly_id}", auth=JWTAuth(), response={200: OsztalySchema, 401: ErrorSchema, 404: ErrorSchema})
     def get_class(request, osztaly_id: int):
@@ -538,12 +750,10 @@ def register_academic_endpoints(api):
             401: Authentication failed
         """
         try:
-            osztaly = Osztaly.objects.prefetch_related('tanevek').get(id=osztaly_id)
+            osztaly = get_osztaly_queryset().get(id=osztaly_id)
             return 200, create_osztaly_response(osztaly)
         except Osztaly.DoesNotExist:
             return 404, {"message": "Osztály nem található"}
-        except Exception as e:
-            return 401, {"message": f"Error fetching class: {str(e)}"}
 
     @api.get("/classes/by-section/{szekcio}", auth=JWTAuth(), response={200: list[OsztalySchema], 401: ErrorSchema})
     def get_classes_by_section(request, szekcio: str):
@@ -559,18 +769,18 @@ def register_academic_endpoints(api):
             200: List of classes in section
             401: Authentication failed
         """
-        try:
-            classes = Osztaly.objects.prefetch_related('tanevek').filter(
-                szekcio__iexact=szekcio
-            )
-            
-            response = []
-            for osztaly in classes:
-                response.append(create_osztaly_response(osztaly))
-            
-            return 200, response
-        except Exception as e:
-            return 401, {"message": f"Error fetching classes by section: {str(e)}"}
+        # A szekciót mindig nagybetűsen tároljuk (lásd Osztaly.save),
+        # így pontos egyezéssel az indexet is használhatjuk.
+        classes = get_osztaly_queryset().filter(
+            szekcio=szekcio.upper()
+        )
+        active_tanev = Tanev.get_active()
+        tanev_responses = {}
+        
+        return 200, [
+            create_osztaly_response(osztaly, active_tanev, tanev_responses)
+            for osztaly in classes.iterator(chunk_size=500)
+        ]
 
     @api.post("/classes", auth=JWTAuth(), response={201: OsztalySchema, 400: ErrorSchema, 401: ErrorSchema})
     def create_class(request, data: OsztalyCreateSchema):
@@ -594,23 +804,23 @@ def register_academic_endpoints(api):
                 return 401, {"message": error_message}
             
             # Validate section
-            if len(data.szekcio) != 1:
-                return 400, {"message": "A szekció egy karakterből kell álljon"}
+            szekcio = data.szekcio.upper()
+            if szekcio not in _VALID_SZEKCIOK:
+                return 400, {"message": "A szekció egyetlen betű lehet (A-Z)"}
             
-            # Get school year if provided
-            tanev = None
-            if data.tanev_id:
-                try:
-                    tanev = Tanev.objects.get(id=data.tanev_id)
-                except Tanev.DoesNotExist:
-                    return 400, {"message": "Tanév nem található"}
+            # Validate school year if provided (the row itself is not needed,
+            # the M2M link can be created by id)
+            if data.tanev_id and not Tanev.objects.filter(id=data.tanev_id).exists():
+                return 400, {"message": "Tanév nem található"}
             
-            osztaly = Osztaly.objects.create(
-                startYear=data.start_year,
-                szekcio=data.szekcio.upper(),
-            )
-            if tanev is not None:
-                tanev.add_osztaly(osztaly)
+            # Az osztály és a tanév-kapcsolat egy tranzakcióban (egy commit)
+            with transaction.atomic():
+                osztaly = Osztaly.objects.create(
+                    startYear=data.start_year,
+                    szekcio=szekcio,
+                )
+                if data.tanev_id:
+                    osztaly.tanevek.add(data.tanev_id)
             
             return 201, create_osztaly_response(osztaly)
         except Exception as e:
@@ -640,26 +850,33 @@ def register_academic_endpoints(api):
             if not has_permission:
                 return 401, {"message": error_message}
             
-            osztaly = Osztaly.objects.get(id=osztaly_id)
-            
             # Update fields only if they are provided (not None)
+            changes = {}
             if data.start_year is not None:
-                osztaly.startYear = data.start_year
+                changes['startYear'] = data.start_year
             if data.szekcio is not None:
-                if len(data.szekcio) != 1:
-                    return 400, {"message": "A szekció egy karakterből kell álljon"}
-                osztaly.szekcio = data.szekcio.upper()
+                szekcio = data.szekcio.upper()
+                if szekcio not in _VALID_SZEKCIOK:
+                    return 400, {"message": "A szekció egyetlen betű lehet (A-Z)"}
+                changes['szekcio'] = szekcio
             if data.tanev_id is not None:
-                try:
-                    tanev = Tanev.objects.get(id=data.tanev_id)
-                    # Az osztály tanévhez rendelését a M2M-en keresztül kezeljük.
-                    tanev.add_osztaly(osztaly)
-                except Tanev.DoesNotExist:
+                # Validate school year without fetching the row; the link is created by id
+                if not Tanev.objects.filter(id=data.tanev_id).exists():
                     return 400, {"message": "Tanév nem található"}
             
-            osztaly.save()
+            # Csak a megadott oszlopokat írjuk (UPDATE ... SET <changes>), az
+            # osztályt nem kell előtte betölteni. Az Osztaly-ra nincs save signal.
+            with transaction.atomic():
+                osztalyok = Osztaly.objects.filter(id=osztaly_id)
+                found = osztalyok.update(**changes) if changes else osztalyok.exists()
+                if not found:
+                    return 404, {"message": "Osztály nem található"}
+                
+                if data.tanev_id is not None:
+                    # Az osztály tanévhez rendelését a M2M-en keresztül kezeljük.
+                    Tanev.osztalyok.through.objects.get_or_create(tanev_id=data.tanev_id, osztaly_id=osztaly_id)
             
-            return 200, create_osztaly_response(osztaly)
+            return 200, create_osztaly_response(get_osztaly_queryset().get(id=osztaly_id))
         except Osztaly.DoesNotExist:
             return 404, {"message": "Osztály nem található"}
         except Exception as e:
@@ -751,7 +968,7 @@ def register_academic_endpoints(api):
             401: Authentication failed
         """
         try:
-            osztaly = Osztaly.objects.prefetch_related('tanevek').get(id=osztaly_id)
+            osztaly = get_osztaly_queryset().get(id=osztaly_id)
             return 200, create_osztaly_with_teachers_response(osztaly)
         except Osztaly.DoesNotExist:
             return 404, {"message": "Osztály nem található"}
@@ -878,13 +1095,14 @@ def register_academic_endpoints(api):
                 if not has_permission:
                     return 401, {"message": "Csak saját osztályait vagy adminisztrátorként tekintheti meg"}
             
-            classes = Osztaly.objects.filter(osztaly_fonokei=user).prefetch_related('tanevek')
-            
-            response = []
-            for osztaly in classes:
-                response.append(create_osztaly_response(osztaly))
+            classes = get_osztaly_queryset().filter(osztaly_fonokei=user)
+            active_tanev = Tanev.get_active()
+            tanev_responses = {}
             
-            return 200, response
+            return 200, [
+                create_osztaly_response(osztaly, active_tanev, tanev_responses)
+                for osztaly in classes.iterator(chunk_size=500)
+            ]
         except User.DoesNotExist:
             return 404, {"message": "Felhasználó nem található"}
         except Exception as e:
@@ -77,12 +77,23 @@ Integrációs pontok:
 
 from ninja import Schema
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Count
-from api.models import Beosztas, SzerepkorRelaciok, Szerepkor, Forgatas, Absence, Profile, Tavollet, RadioSession, Stab
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.db.models import Count, Prefetch, Q
+from django.http import JsonResponse
+from django.utils import timezone
+from api.models import Beosztas, SzerepkorRelaciok, Szerepkor, Forgatas, Absence, Profile, Tavollet, RadioSession, Stab, Osztaly
 from .auth import JWTAuth, ErrorSchema
-from datetime import datetime, date, time
+from .authentication import send_assignment_change_notification_email
+from .core import stream_json_list
+from datetime import datetime, date, time, timedelta
+from collections import Counter, defaultdict
 from typing import Optional, List
+import logging
+
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Schemas
@@ -127,6 +138,7 @@ class BeosztasSchema(Schema):
     szerepkor_relaciok: List[SzerepkorRelacioSchema]
     kesz: bool
     author: Optional[UserBasicSchema] = None
+    stab: Optional[dict] = None
     created_at: str
     student_count: int
     roles_summary: List[dict]
@@ -150,6 +162,7 @@ class BeosztasWithAvailabilitySchema(Schema):
     szerepkor_relaciok: List[SzerepkorRelacioSchema]
     kesz: bool
     author: Optional[UserBasicSchema] = None
+    stab: Optional[dict] = None
     created_at: str
     student_count: int
     roles_summary: List[dict]
@@ -208,230 +221,160 @@ class ClassMatrixResponseSchema(Schema):
 
 def create_user_basic_response(user: User) -> dict:
     """Create basic user information response."""
-    print(f"🔍 [DEBUG] create_user_basic_response called with user: {user}")
-    
-    try:
-        if not user:
-            print(f"❌ [DEBUG] User is None!")
-            raise ValueError("User cannot be None")
-        
-        print(f"🔍 [DEBUG] User ID: {user.id}")
-        print(f"🔍 [DEBUG] User username: '{user.username}'")
-        print(f"🔍 [DEBUG] User first_name: '{user.first_name}'")
-        print(f"🔍 [DEBUG] User last_name: '{user.last_name}'")
-        
-        # Test get_full_name separately
-        try:
-            full_name = user.get_full_name()
-            print(f"🔍 [DEBUG] User full_name: '{full_name}'")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error getting full_name: {str(e)}")
-            raise
-        
-        response = {
-            "id": user.id,
-            "username": user.username,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "full_name": full_name
-        }
-        
-        print(f"✅ [DEBUG] create_user_basic_response completed: {response}")
-        return response
-        
-    except Exception as e:
-        print(f"❌ [DEBUG] Error in create_user_basic_response: {str(e)}")
-        print(f"❌ [DEBUG] Error type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
-        raise
+    return {
+        "id": user.id,
+        "username": user.username,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "full_name": user.get_full_name()
+    }
 
 def create_szerepkor_response(szerepkor: Szerepkor) -> dict:
     """Create role information response."""
-    print(f"🔍 [DEBUG] create_szerepkor_response called with szerepkor: {szerepkor}")
-    
-    try:
-        if not szerepkor:
-            print(f"❌ [DEBUG] Szerepkor is None!")
-            raise ValueError("Szerepkor cannot be None")
-        
-        print(f"🔍 [DEBUG] Szerepkor ID: {szerepkor.id}")
-        print(f"🔍 [DEBUG] Szerepkor name: '{szerepkor.name}'")
-        print(f"🔍 [DEBUG] Szerepkor ev: {szerepkor.ev}")
-        
-        response = {
-            "id": szerepkor.id,
-            "name": szerepkor.name,
-            "ev": szerepkor.ev
-        }
-        
-        print(f"✅ [DEBUG] create_szerepkor_response completed: {response}")
-        return response
-        
-    except Exception as e:
-        print(f"❌ [DEBUG] Error in create_szerepkor_response: {str(e)}")
-        print(f"❌ [DEBUG] Error type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
-        raise
+    return {
+        "id": szerepkor.id,
+        "name": szerepkor.name,
+        "ev": szerepkor.ev
+    }
 
 def create_szerepkor_relacio_response(relacio: SzerepkorRelaciok) -> dict:
     """Create role relation response."""
-    print(f"🔍 [DEBUG] create_szerepkor_relacio_response called with relacio: {relacio}")
-    
-    try:
-        if not relacio:
-            print(f"❌ [DEBUG] Relacio is None!")
-            raise ValueError("Relacio cannot be None")
-        
-        print(f"🔍 [DEBUG] Relacio ID: {relacio.id}")
-        print(f"🔍 [DEBUG] Relacio user: {relacio.user}")
-        print(f"🔍 [DEBUG] Relacio szerepkor: {relacio.szerepkor}")
-        
-        # Create user response
-        try:
-            user_response = create_user_basic_response(relacio.user)
-            print(f"✅ [DEBUG] User response created in relacio")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error creating user response in relacio: {str(e)}")
-            raise
-        
-        # Create szerepkor response
-        try:
-            szerepkor_response = create_szerepkor_response(relacio.szerepkor)
-            print(f"✅ [DEBUG] Szerepkor response created in relacio")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error creating szerepkor response in relacio: {str(e)}")
-            raise
-        
-        response = {
-            "id": relacio.id,
-            "user": user_response,
-            "szerepkor": szerepkor_response
-        }
-        
-        print(f"✅ [DEBUG] create_szerepkor_relacio_response completed: {response}")
-        return response
-        
-    except Exception as e:
-        print(f"❌ [DEBUG] Error in create_szerepkor_relacio_response: {str(e)}")
-        print(f"❌ [DEBUG] Error type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
-        raise
+    return {
+        "id": relacio.id,
+        "user": create_user_basic_response(relacio.user),
+        "szerepkor": create_szerepkor_response(relacio.szerepkor)
+    }
 
 def create_forgatas_basic_response(forgatas: Forgatas) -> dict:
     """Create basic forgatas information response."""
-    print(f"🔍 [DEBUG] create_forgatas_basic_response called with forgatas: {forgatas}")
+    return {
+        "id": forgatas.id,
+        "name": forgatas.name,
+        "description": forgatas.description,
+        "date": forgatas.date.isoformat(),
+        "time_from": forgatas.timeFrom.isoformat(),
+        "time_to": forgatas.timeTo.isoformat(),
+        "type": forgatas.forgTipus,
+        # szerkeszto_id avoids loading the user when there is no szerkesztő
+        "szerkeszto": create_user_basic_response(forgatas.szerkeszto) if forgatas.szerkeszto_id else None,
+        "notes": forgatas.notes
+    }
+
+# Rows per chunk when assignment lists are streamed with QuerySet.iterator();
+# the role relation prefetch runs once per chunk
+ASSIGNMENT_LIST_CHUNK_SIZE = 500
+
+def get_beosztas_queryset():
+    """
+    Assignment queryset with every relation the response builders touch.
     
-    try:
-        if not forgatas:
-            print(f"❌ [DEBUG] Forgatas is None!")
-            raise ValueError("Forgatas cannot be None")
-        
-        print(f"🔍 [DEBUG] Forgatas ID: {forgatas.id}")
-        print(f"🔍 [DEBUG] Forgatas name: '{forgatas.name}'")
-        print(f"🔍 [DEBUG] Forgatas description: '{forgatas.description}'")
-        print(f"🔍 [DEBUG] Forgatas date: {forgatas.date}")
-        print(f"🔍 [DEBUG] Forgatas timeFrom: {forgatas.timeFrom}")
-        print(f"🔍 [DEBUG] Forgatas timeTo: {forgatas.timeTo}")
-        print(f"🔍 [DEBUG] Forgatas forgTipus: '{forgatas.forgTipus}'")
-        
-        # Check each field individually to isolate the issue
-        response = {}
-        
-        # ID
-        response["id"] = forgatas.id
-        print(f"✅ [DEBUG] Added ID: {response['id']}")
-        
-        # Name
-        response["name"] = forgatas.name
-        print(f"✅ [DEBUG] Added name: '{response['name']}'")
-        
-        # Description
-        response["description"] = forgatas.description
-        print(f"✅ [DEBUG] Added description: '{response['description']}'")
-        
-        # Date
-        try:
-            response["date"] = forgatas.date.isoformat()
-            print(f"✅ [DEBUG] Added date: '{response['date']}'")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error with date field: {str(e)}")
-            raise
-        
-        # Time From
-        try:
-            response["time_from"] = forgatas.timeFrom.isoformat()
-            print(f"✅ [DEBUG] Added time_from: '{response['time_from']}'")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error with timeFrom field: {str(e)}")
-            raise
-        
-        # Time To
-        try:
-            response["time_to"] = forgatas.timeTo.isoformat()
-            print(f"✅ [DEBUG] Added time_to: '{response['time_to']}'")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error with timeTo field: {str(e)}")
-            raise
-        
-        # Type
-        response["type"] = forgatas.forgTipus
-        print(f"✅ [DEBUG] Added type: '{response['type']}'")
-        
-        # Szerkesztő
-        try:
-            if forgatas.szerkeszto:
-                response["szerkeszto"] = create_user_basic_response(forgatas.szerkeszto)
-                print(f"✅ [DEBUG] Added szerkeszto: '{response['szerkeszto']}'")
-            else:
-                response["szerkeszto"] = None
-                print(f"✅ [DEBUG] Added szerkeszto: null")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error with szerkeszto field: {str(e)}")
-            raise
-        
-        # Notes
-        try:
-            response["notes"] = forgatas.notes
-            print(f"✅ [DEBUG] Added notes: '{response['notes']}'")
-        except Exception as e:
-            print(f"❌ [DEBUG] Error with notes field: {str(e)}")
-            raise
-        
-        print(f"✅ [DEBUG] create_forgatas_basic_response completed successfully: {response}")
-        return response
-        
-    except Exception as e:
-        print(f"❌ [DEBUG] Error in create_forgatas_basic_response: {str(e)}")
-        print(f"❌ [DEBUG] Error type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
-        raise
-
-def create_beosztas_response(beosztas: Beosztas) -> dict:
-    """Create standardized assignment response dictionary."""
-    # Get role relations
-    szerepkor_relaciok = beosztas.szerepkor_relaciok.select_related('user', 'szerepkor').all()
+    Forgatas, szerkeszto, author and stab are joined in; the role relations
+    come from one prefetch query with their user and szerepkor joined, so
+    list endpoints do not issue queries per assignment or per relation.
+    """
+    return Beosztas.objects.select_related(
+        'forgatas', 'forgatas__szerkeszto', 'author', 'stab'
+    ).prefetch_related(
+        Prefetch(
+            'szerepkor_relaciok',
+            queryset=SzerepkorRelaciok.objects.select_related('user', 'szerepkor')
+        )
+    )
+
+def get_assignment_list_filters(forgatas_id: Optional[int], kesz: Optional[bool], start_date: Optional[str],
+                                end_date: Optional[str], stab_id: Optional[int]) -> dict:
+    """
+    Build the filter kwargs of the assignment list endpoints.
     
-    # Create roles summary (count by role)
-    roles_summary = {}
+    kesz and stab filters combined with the created_at ordering are covered by
+    the Beosztas list indexes; the date range by the Forgatas.date index.
+    Raises ValueError with a user-facing message for a malformed date.
+    """
+    filters = {}
+    if forgatas_id:
+        filters['forgatas_id'] = forgatas_id
+    if kesz is not None:
+        filters['kesz'] = kesz
+    if stab_id:
+        filters['stab_id'] = stab_id
+    for name, value, lookup in (('start_date', start_date, 'forgatas__date__gte'),
+                                ('end_date', end_date, 'forgatas__date__lte')):
+        if value:
+            try:
+                filters[lookup] = date.fromisoformat(value)
+            except ValueError:
+                raise ValueError(f"Hibás dátum formátum ({name})")
+    return filters
+
+def get_beosztas_for_update(lock: bool = False, **lookup) -> Beosztas:
+    """
+    Load an assignment that is about to be saved.
+    
+    Beosztas.save() reads tanev and the absence bookkeeping reads forgatas,
+    so both are joined in instead of being fetched one by one. Every column of
+    Beosztas is a small scalar or key, so no field is deferred.
+    
+    With lock=True only the assignment row is locked (SELECT ... FOR UPDATE)
+    until the surrounding transaction.atomic() block ends, so concurrent
+    requests changing the same assignment run one after the other.
+    """
+    queryset = Beosztas.objects.select_related('forgatas', 'tanev')
+    if lock:
+        queryset = queryset.select_for_update(of=('self',))
+    return queryset.get(**lookup)
+
+def add_relation_responses(beosztas: Beosztas, szerepkor_relaciok, user_responses: dict, role_responses: dict):
+    """
+    Build the author, user and role dicts of an assignment that are not yet
+    in user_responses / role_responses (keyed by id).
+    
+    List endpoints pass the same dicts for every assignment, so a student or
+    role appearing in many assignments is serialized only once per request.
+    """
+    if beosztas.author_id and beosztas.author_id not in user_responses:
+        user_responses[beosztas.author_id] = create_user_basic_response(beosztas.author)
     for relacio in szerepkor_relaciok:
-        role_name = relacio.szerepkor.name
-        if role_name not in roles_summary:
-            roles_summary[role_name] = 0
-        roles_summary[role_name] += 1
+        if relacio.user_id not in user_responses:
+            user_responses[relacio.user_id] = create_user_basic_response(relacio.user)
+        if relacio.szerepkor_id not in role_responses:
+            role_responses[relacio.szerepkor_id] = create_szerepkor_response(relacio.szerepkor)
+
+def create_beosztas_response(beosztas: Beosztas, user_responses: Optional[dict] = None,
+                             role_responses: Optional[dict] = None) -> dict:
+    """
+    Create standardized assignment response dictionary.
     
+    Expects a beosztas loaded through get_beosztas_queryset(); otherwise every
+    relation access below issues its own query. See add_relation_responses()
+    for user_responses / role_responses.
+    """
+    if user_responses is None:
+        user_responses = {}
+    if role_responses is None:
+        role_responses = {}
+    
+    # Get role relations (prefetched)
+    szerepkor_relaciok = beosztas.szerepkor_relaciok.all()
+    add_relation_responses(beosztas, szerepkor_relaciok, user_responses, role_responses)
+    
+    # Create roles summary (count by role)
+    roles_summary = Counter(relacio.szerepkor.name for relacio in szerepkor_relaciok)
     roles_summary_list = [{"role": role, "count": count} for role, count in roles_summary.items()]
     
     return {
         "id": beosztas.id,
         "forgatas": create_forgatas_basic_response(beosztas.forgatas),
-        "szerepkor_relaciok": [create_szerepkor_relacio_response(rel) for rel in szerepkor_relaciok],
+        "szerepkor_relaciok": [
+            {
+                "id": rel.id,
+                "user": user_responses[rel.user_id],
+                "szerepkor": role_responses[rel.szerepkor_id]
+            }
+            for rel in szerepkor_relaciok
+        ],
         "kesz": beosztas.kesz,
-        "author": create_user_basic_response(beosztas.author) if beosztas.author else None,
-        "stab": {"id": beosztas.stab.id, "name": beosztas.stab.name} if beosztas.stab else None,
+        "author": user_responses[beosztas.author_id] if beosztas.author_id else None,
+        "stab": {"id": beosztas.stab_id, "name": beosztas.stab.name} if beosztas.stab_id else None,
         "created_at": beosztas.created_at.isoformat(),
         "student_count": len(szerepkor_relaciok),
         "roles_summary": roles_summary_list
@@ -439,48 +382,114 @@ def create_beosztas_response(beosztas: Beosztas) -> dict:
 
 def check_admin_or_teacher_permissions(user: User) -> tuple[bool, str]:
     """Check if user has admin or teacher permissions for assignment management."""
-    try:
-        from api.models import Profile
-        profile = Profile.objects.get(user=user)
-        if not profile.has_admin_permission('any'):
-            return False, "Adminisztrátor vagy tanár jogosultság szükséges"
-        return True, ""
-    except Profile.DoesNotExist:
+    # request.auth profile-ja a JWTAuth-ban már be van töltve; hiányzó profilnál None
+    profile = getattr(user, 'profile', None)
+    if profile is None:
         return False, "Felhasználói profil nem található"
+    if not profile.has_admin_permission('any'):
+        return False, "Adminisztrátor vagy tanár jogosultság szükséges"
+    return True, ""
 
 def check_admin_only_permissions(user: User) -> tuple[bool, str]:
     """Check if user has admin-only permissions for sensitive operations like editing Beosztás."""
-    try:
-        from api.models import Profile
-        profile = Profile.objects.get(user=user)
-        # Only allow users with admin permissions (not just teachers)
-        if not profile.has_admin_permission('system_admin'):
-            return False, "Rendszergazda jogosultság szükséges a beosztások szerkesztéséhez"
-        return True, ""
-    except Profile.DoesNotExist:
+    profile = getattr(user, 'profile', None)
+    if profile is None:
         return False, "Felhasználói profil nem található"
+    # Only allow users with admin permissions (not just teachers)
+    if not profile.has_admin_permission('system_admin'):
+        return False, "Rendszergazda jogosultság szükséges a beosztások szerkesztéséhez"
+    return True, ""
 
 def can_user_manage_beosztas(user: User, beosztas: Beosztas) -> bool:
     """Check if user can manage a specific assignment."""
     # Author can manage their own assignment
-    if beosztas.author and beosztas.author.id == user.id:
+    if beosztas.author_id is not None and beosztas.author_id == user.id:
         return True
     
     # Admin can manage any assignment
-    try:
-        from api.models import Profile
-        profile = Profile.objects.get(user=user)
-        if profile.has_admin_permission('any'):
-            return True
-    except Profile.DoesNotExist:
-        pass
+    profile = getattr(user, 'profile', None)
+    return profile is not None and profile.has_admin_permission('any')
+
+# Whether a pending (neither approved nor denied) vacation makes the user
+# unavailable, by its tipus' ignored_counts_as; no tipus counts as unavailable
+PENDING_VACATION_UNAVAILABLE = {
+    'approved': True,
+    'denied': False,
+    None: True,
+}
+
+def get_availability_conflicts(user_ids: List[int], forgatas: Forgatas) -> tuple[dict, dict, dict]:
+    """
+    Fetch the possible conflicts of several users for a forgatas at once.
+    
+    Returns three dicts keyed by user id: overlapping vacations (Tavollet),
+    the conflict entries of overlapping radio sessions and other finalized
+    assignments on the forgatas date. Three queries in total, whatever the
+    number of users. A radio session's conflict entry is built once and
+    shared by all of its participants.
+    """
+    forgatas_start = datetime.combine(forgatas.date, forgatas.timeFrom)
+    forgatas_end = datetime.combine(forgatas.date, forgatas.timeTo)
     
-    return False
+    vacations_by_user = defaultdict(list)
+    for vacation in Tavollet.objects.filter(
+        user_id__in=user_ids,
+        start_date__lt=forgatas_end,
+        end_date__gt=forgatas_start
+    ).select_related('tipus'):
+        vacations_by_user[vacation.user_id].append(vacation)
+    
+    radio_conflicts_by_user = defaultdict(list)
+    session_conflicts = {}
+    for participation in RadioSession.participants.through.objects.filter(
+        user_id__in=user_ids,
+        radiosession__date=forgatas.date
+    ).select_related('radiosession__radio_stab').order_by('radiosession__date', 'radiosession__time_from'):
+        session_id = participation.radiosession_id
+        if session_id not in session_conflicts:
+            session = participation.radiosession
+            session_date, time_from, time_to = session.date, session.time_from, session.time_to
+            # Check if radio session overlaps with forgatas time
+            session_start = datetime.combine(session_date, time_from)
+            session_end = datetime.combine(session_date, time_to)
+            if session_start < forgatas_end and session_end > forgatas_start:
+                radio_stab_name = session.radio_stab.name
+                session_conflicts[session_id] = {
+                    "type": "radio_session",
+                    "description": f"{radio_stab_name} rádiós összejátszás",
+                    "date": session_date.isoformat(),
+                    "time_from": time_from.isoformat(),
+                    "time_to": time_to.isoformat(),
+                    "radio_stab": radio_stab_name
+                }
+            else:
+                session_conflicts[session_id] = None
+        session_conflict = session_conflicts[session_id]
+        if session_conflict:
+            radio_conflicts_by_user[participation.user_id].append(session_conflict)
+    
+    # Only finalized assignments of other forgatások count as conflicts
+    assignments_by_user = defaultdict(list)
+    for assignment_relation in Beosztas.szerepkor_relaciok.through.objects.filter(
+        szerepkorrelaciok__user_id__in=user_ids,
+        beosztas__forgatas__date=forgatas.date,
+        beosztas__kesz=True
+    ).exclude(
+        beosztas__forgatas=forgatas
+    ).select_related('beosztas__forgatas', 'szerepkorrelaciok').order_by('-beosztas__created_at'):
+        assignments_by_user[assignment_relation.szerepkorrelaciok.user_id].append(assignment_relation.beosztas)
+    
+    return vacations_by_user, radio_conflicts_by_user, assignments_by_user
 
-def check_user_availability_for_forgatas(user: User, forgatas: Forgatas) -> dict:
+def check_user_availability_for_forgatas(user: User, forgatas: Forgatas, vacations: Optional[list] = None,
+                                         radio_session_conflicts: Optional[list] = None,
+                                         other_assignments: Optional[list] = None) -> dict:
     """
     Check user availability for a specific forgatas.
     Returns detailed availability information including conflicts.
+    
+    The possible conflicts can be passed in from get_availability_conflicts()
+    when checking many users; otherwise they are queried for this user.
     """
     if not forgatas:
         return {
@@ -495,6 +504,27 @@ def check_user_availability_for_forgatas(user: User, forgatas: Forgatas) -> dict
             "has_radio_session": False
         }
     
+    if vacations is None or radio_session_conflicts is None or other_assignments is None:
+        vacations_by_user, radio_conflicts_by_user, assignments_by_user = get_availability_conflicts([user.id], forgatas)
+        vacations = vacations_by_user[user.id]
+        radio_session_conflicts = radio_conflicts_by_user[user.id]
+        other_assignments = assignments_by_user[user.id]
+    
+    # Most users have nothing on that day; skip the conflict checks for them
+    if not vacations and not radio_session_conflicts and not other_assignments:
+        return {
+            "user_id": user.id,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "full_name": user.get_full_name(),
+            "is_available": True,
+            "conflicts": [],
+            "is_on_vacation": False,
+            "has_radio_session": False,
+            "has_other_assignment": False
+        }
+    
     # Create datetime objects for the forgatas
     forgatas_start = datetime.combine(forgatas.date, forgatas.timeFrom)
     forgatas_end = datetime.combine(forgatas.date, forgatas.timeTo)
@@ -503,102 +533,58 @@ def check_user_availability_for_forgatas(user: User, forgatas: Forgatas) -> dict
     is_on_vacation = False
     has_radio_session = False
     
-    # Check for vacation (Tavollet) conflicts
-    # Convert forgatas date to datetime range for comparison
-    forgatas_start = datetime.combine(forgatas.date, forgatas.timeFrom)
-    forgatas_end = datetime.combine(forgatas.date, forgatas.timeTo)
-    
     # Check for vacation (Tavollet) conflicts with TavolletTipus logic
-    vacation_conflicts = Tavollet.objects.filter(
-        user=user,
-        start_date__lt=forgatas_end,
-        end_date__gt=forgatas_start
-    ).select_related('tipus')
-    
-    for vacation in vacation_conflicts:
+    for vacation in vacations:
         # Apply the same logic as Profile.is_available_for_datetime
-        should_count_as_unavailable = False
-        
+        tipus = vacation.tipus
         if vacation.denied:
             # Explicitly denied - user is available (skip this absence)
             continue
-        elif vacation.approved:
-            # Explicitly approved - user is not available
-            should_count_as_unavailable = True
-        else:
-            # Pending absence - check tipus
-            if vacation.tipus:
-                if vacation.tipus.ignored_counts_as == 'approved':
-                    # Type defaults to approved when ignored - user not available
-                    should_count_as_unavailable = True
-                # If ignored_counts_as == 'denied', user is available (skip)
-            else:
-                # No tipus specified for pending absence - conservative approach (not available)
-                should_count_as_unavailable = True
+        if not vacation.approved and not PENDING_VACATION_UNAVAILABLE.get(
+            tipus.ignored_counts_as if tipus else None, False
+        ):
+            # Pending absence whose tipus counts as denied - user is available
+            continue
         
-        if should_count_as_unavailable:
-            is_on_vacation = True
-            conflicts.append({
-                "type": "vacation",
-                "reason": vacation.reason or "Távollét",
-                "start_date": vacation.start_date.isoformat(),
-                "end_date": vacation.end_date.isoformat(),
-                "approved": vacation.approved,
-                "tipus": {
-                    "id": vacation.tipus.id,
-                    "name": vacation.tipus.name,
-                    "ignored_counts_as": vacation.tipus.ignored_counts_as
-                } if vacation.tipus else None
-            })
-    
-    # Check for radio session conflicts (for all users)
-    radio_sessions = RadioSession.objects.filter(
-        participants=user,
-        date=forgatas.date
-    )
+        is_on_vacation = True
+        conflicts.append({
+            "type": "vacation",
+            "reason": vacation.reason or "Távollét",
+            "start_date": vacation.start_date.isoformat(),
+            "end_date": vacation.end_date.isoformat(),
+            "approved": vacation.approved,
+            "tipus": {
+                "id": tipus.id,
+                "name": tipus.name,
+                "ignored_counts_as": tipus.ignored_counts_as
+            } if tipus else None
+        })
     
-    for session in radio_sessions:
-        # Check if radio session overlaps with forgatas time
-        session_start = datetime.combine(session.date, session.time_from)
-        session_end = datetime.combine(session.date, session.time_to)
-        
-        if session_start < forgatas_end and session_end > forgatas_start:
-            has_radio_session = True
-            conflicts.append({
-                "type": "radio_session",
-                "description": f"{session.radio_stab.name} rádiós összejátszás",
-                "date": session.date.isoformat(),
-                "time_from": session.time_from.isoformat(),
-                "time_to": session.time_to.isoformat(),
-                "radio_stab": session.radio_stab.name
-            })
+    # Check for radio session conflicts (for all users); only overlapping sessions are passed in
+    if radio_session_conflicts:
+        has_radio_session = True
+        conflicts.extend(radio_session_conflicts)
     
     # Check for other filming assignment conflicts
-    # Find other finalized assignments (beosztás) for the same date and overlapping time
-    other_assignments = Beosztas.objects.filter(
-        szerepkor_relaciok__user=user,
-        forgatas__date=forgatas.date,
-        kesz=True  # Only check finalized assignments
-    ).exclude(
-        forgatas=forgatas  # Exclude current forgatas
-    ).select_related('forgatas')
-    
+    # Other finalized assignments (beosztás) for the same date; keep the overlapping ones
     has_other_assignment = False
     for assignment in other_assignments:
-        if assignment.forgatas:
-            assignment_start = datetime.combine(assignment.forgatas.date, assignment.forgatas.timeFrom)
-            assignment_end = datetime.combine(assignment.forgatas.date, assignment.forgatas.timeTo)
+        other_forgatas = assignment.forgatas
+        if other_forgatas:
+            other_date, other_from, other_to = other_forgatas.date, other_forgatas.timeFrom, other_forgatas.timeTo
+            assignment_start = datetime.combine(other_date, other_from)
+            assignment_end = datetime.combine(other_date, other_to)
             
             if assignment_start < forgatas_end and assignment_end > forgatas_start:
                 has_other_assignment = True
                 conflicts.append({
                     "type": "other_assignment",
-                    "description": f"Már beosztva: {assignment.forgatas.name}",
-                    "forgatas_id": assignment.forgatas.id,
-                    "forgatas_name": assignment.forgatas.name,
-                    "date": assignment.forgatas.date.isoformat(),
-                    "time_from": assignment.forgatas.timeFrom.isoformat(),
-                    "time_to": assignment.forgatas.timeTo.isoformat(),
+                    "description": f"Már beosztva: {other_forgatas.name}",
+                    "forgatas_id": other_forgatas.id,
+                    "forgatas_name": other_forgatas.name,
+                    "date": other_date.isoformat(),
+                    "time_from": other_from.isoformat(),
+                    "time_to": other_to.isoformat(),
                 })
     
     # User is available if they have no conflicts
@@ -617,69 +603,83 @@ def check_user_availability_for_forgatas(user: User, forgatas: Forgatas) -> dict
         "has_other_assignment": has_other_assignment
     }
 
-def create_beosztas_with_availability_response(beosztas: Beosztas) -> dict:
-    """Create standardized assignment response dictionary with user availability."""
-    # Get role relations
-    szerepkor_relaciok = beosztas.szerepkor_relaciok.select_related('user', 'szerepkor').all()
+def create_beosztas_with_availability_response(beosztas: Beosztas, user_responses: Optional[dict] = None,
+                                               role_responses: Optional[dict] = None) -> dict:
+    """
+    Create standardized assignment response dictionary with user availability.
     
-    # Create roles summary (count by role)
-    roles_summary = {}
-    for relacio in szerepkor_relaciok:
-        role_name = relacio.szerepkor.name
-        if role_name not in roles_summary:
-            roles_summary[role_name] = 0
-        roles_summary[role_name] += 1
+    Expects a beosztas loaded through get_beosztas_queryset(). See
+    add_relation_responses() for user_responses / role_responses.
+    """
+    if user_responses is None:
+        user_responses = {}
+    if role_responses is None:
+        role_responses = {}
+    
+    # Get role relations (prefetched)
+    szerepkor_relaciok = beosztas.szerepkor_relaciok.all()
     
+    # Create roles summary (count by role)
+    roles_summary = Counter(relacio.szerepkor.name for relacio in szerepkor_relaciok)
     roles_summary_list = [{"role": role, "count": count} for role, count in roles_summary.items()]
     
+    # Build every user and role dict once; the relation list and the
+    # availability groups below share them
+    add_relation_responses(beosztas, szerepkor_relaciok, user_responses, role_responses)
+    
     # Check availability for each user
     users_available = []
     users_on_vacation = []
     users_with_radio_session = []
     users_with_other_assignment = []
     
+    # Fetch the conflicts of all assigned users at once instead of per user
+    if beosztas.forgatas:
+        vacations_by_user, radio_conflicts_by_user, assignments_by_user = get_availability_conflicts(
+            [relacio.user_id for relacio in szerepkor_relaciok], beosztas.forgatas
+        )
+    else:
+        vacations_by_user = radio_conflicts_by_user = assignments_by_user = defaultdict(list)
+    
     for relacio in szerepkor_relaciok:
-        user_availability = check_user_availability_for_forgatas(relacio.user, beosztas.forgatas)
+        user_availability = check_user_availability_for_forgatas(
+            relacio.user, beosztas.forgatas,
+            vacations=vacations_by_user[relacio.user_id],
+            radio_session_conflicts=radio_conflicts_by_user[relacio.user_id],
+            other_assignments=assignments_by_user[relacio.user_id]
+        )
+        user_entry = {
+            "user": user_responses[relacio.user_id],
+            "role": role_responses[relacio.szerepkor_id],
+            "availability": user_availability
+        }
         
         if user_availability["is_available"]:
-            users_available.append({
-                "user": create_user_basic_response(relacio.user),
-                "role": create_szerepkor_response(relacio.szerepkor),
-                "availability": user_availability
-            })
+            users_available.append(user_entry)
         elif user_availability["is_on_vacation"]:
-            users_on_vacation.append({
-                "user": create_user_basic_response(relacio.user),
-                "role": create_szerepkor_response(relacio.szerepkor),
-                "availability": user_availability
-            })
+            users_on_vacation.append(user_entry)
         elif user_availability["has_radio_session"]:
-            users_with_radio_session.append({
-                "user": create_user_basic_response(relacio.user),
-                "role": create_szerepkor_response(relacio.szerepkor),
-                "availability": user_availability
-            })
+            users_with_radio_session.append(user_entry)
         elif user_availability.get("has_other_assignment", False):
-            users_with_other_assignment.append({
-                "user": create_user_basic_response(relacio.user),
-                "role": create_szerepkor_response(relacio.szerepkor),
-                "availability": user_availability
-            })
+            users_with_other_assignment.append(user_entry)
         else:
             # User has other types of conflicts, put them in available but mark conflicts
-            users_available.append({
-                "user": create_user_basic_response(relacio.user),
-                "role": create_szerepkor_response(relacio.szerepkor),
-                "availability": user_availability
-            })
+            users_available.append(user_entry)
     
     return {
         "id": beosztas.id,
         "forgatas": create_forgatas_basic_response(beosztas.forgatas),
-        "szerepkor_relaciok": [create_szerepkor_relacio_response(rel) for rel in szerepkor_relaciok],
+        "szerepkor_relaciok": [
+            {
+                "id": rel.id,
+                "user": user_responses[rel.user_id],
+                "szerepkor": role_responses[rel.szerepkor_id]
+            }
+            for rel in szerepkor_relaciok
+        ],
         "kesz": beosztas.kesz,
-        "author": create_user_basic_response(beosztas.author) if beosztas.author else None,
-        "stab": {"id": beosztas.stab.id, "name": beosztas.stab.name} if beosztas.stab else None,
+        "author": user_responses[beosztas.author_id] if beosztas.author_id else None,
+        "stab": {"id": beosztas.stab_id, "name": beosztas.stab.name} if beosztas.stab_id else None,
         "created_at": beosztas.created_at.isoformat(),
         "student_count": len(szerepkor_relaciok),
         "roles_summary": roles_summary_list,
@@ -706,33 +706,50 @@ def auto_create_absences_for_beosztas(beosztas: Beosztas):
     if not beosztas.kesz or not beosztas.forgatas:
         return
     
-    # Get all students in this assignment
-    student_relations = beosztas.szerepkor_relaciok.select_related('user').all()
-    student_ids = [rel.user.id for rel in student_relations]
+    forgatas = beosztas.forgatas
     
-    # Create absences
-    for student_id in student_ids:
-        try:
-            student = User.objects.get(id=student_id)
-            
-            # Check if absence already exists for this student and forgatas
-            existing = Absence.objects.filter(
-                diak=student,
-                forgatas=beosztas.forgatas
-            ).exists()
-            
-            if not existing:
-                Absence.objects.create(
-                    diak=student,
-                    forgatas=beosztas.forgatas,
-                    date=beosztas.forgatas.date,
-                    timeFrom=beosztas.forgatas.timeFrom,
-                    timeTo=beosztas.forgatas.timeTo,
-                    excused=False,
-                    unexcused=False
-                )
-        except User.DoesNotExist:
-            continue
+    # Get all students in this assignment (a student may hold several roles)
+    student_ids = list(dict.fromkeys(
+        beosztas.szerepkor_relaciok.values_list('user_id', flat=True)
+    ))
+    
+    # Students who already have an absence for this forgatas
+    existing_ids = set(Absence.objects.filter(
+        forgatas=forgatas,
+        diak_id__in=student_ids
+    ).values_list('diak_id', flat=True))
+    
+    # Create the missing absences in one query (Absence has no save signals)
+    Absence.objects.bulk_create([
+        Absence(
+            diak_id=student_id,
+            forgatas=forgatas,
+            date=forgatas.date,
+            timeFrom=forgatas.timeFrom,
+            timeTo=forgatas.timeTo,
+            excused=False,
+            unexcused=False
+        )
+        for student_id in student_ids
+        if student_id not in existing_ids
+    ])
+
+# The assignment summary aggregates whole tables, so it is cached for a
+# minute; any change to the data it is built from drops the cached copy. The
+# cache is shared by all workers (settings.CACHES), so the drop reaches every
+# process. Changes that send no signal (QuerySet.update()) are bounded by the
+# timeout only.
+ASSIGNMENTS_SUMMARY_CACHE_KEY = "assignments:summary"
+ASSIGNMENTS_SUMMARY_CACHE_TIMEOUT = 60
+
+@receiver([post_save, post_delete], sender=Beosztas)
+@receiver([post_save, post_delete], sender=Forgatas)
+@receiver([post_save, post_delete], sender=Szerepkor)
+@receiver([post_save, post_delete], sender=SzerepkorRelaciok)
+@receiver(m2m_changed, sender=Beosztas.szerepkor_relaciok.through)
+def invalidate_assignments_summary_cache(sender, **kwargs):
+    """Drop the cached assignment summary when its source data changes."""
+    cache.delete(ASSIGNMENTS_SUMMARY_CACHE_KEY)
 
 # ============================================================================
 # API Endpoints
@@ -754,8 +771,6 @@ def register_assignment_endpoints(api):
             has_perm, msg = check_admin_or_teacher_permissions(requesting_user)
             if not has_perm:
                 return 403, {"message": msg}
-                
-            from api.models import Osztaly
             
             try:
                 osztaly = Osztaly.objects.get(id=class_id)
@@ -775,9 +790,6 @@ def register_assignment_endpoints(api):
                 }
             
             # Fetch all role mappings for these users from finalized assignments
-            from django.db.models import Prefetch
-            from django.utils import timezone
-            
             # Base filters
             filters = {
                 'kesz': True,
@@ -864,7 +876,7 @@ def register_assignment_endpoints(api):
         except Exception as e:
             return 500, {"message": f"Hiba történt a statisztika lekérése során: {str(e)}"}
             
-    @api.get("/assignments/filming-assignments", auth=JWTAuth(), response={200: List[BeosztasSchema], 401: ErrorSchema, 500: ErrorSchema})
+    @api.get("/assignments/filming-assignments", auth=JWTAuth(), response={200: List[BeosztasSchema], 400: ErrorSchema, 401: ErrorSchema, 500: ErrorSchema})
     def get_filming_assignments(request, forgatas_id: int = None, kesz: bool = None, 
                                start_date: str = None, end_date: str = None, stab_id: int = None):
         """
@@ -881,42 +893,31 @@ def register_assignment_endpoints(api):
             
         Returns:
             200: List of assignments
+            400: Invalid date format
             401: Authentication failed
         """
         try:
             requesting_user = request.auth
             
-            # Build queryset
-            assignments = Beosztas.objects.select_related(
-                'forgatas', 'forgatas__szerkeszto', 'author', 'stab'
-            ).prefetch_related(
-                'szerepkor_relaciok__user',
-                'szerepkor_relaciok__szerepkor'
-            ).all()
-            
-            # Apply filters
-            if forgatas_id:
-                assignments = assignments.filter(forgatas_id=forgatas_id)
-            
-            if kesz is not None:
-                assignments = assignments.filter(kesz=kesz)
-            
-            if stab_id:
-                assignments = assignments.filter(stab_id=stab_id)
-            
-            if start_date or end_date:
-                if start_date:
-                    assignments = assignments.filter(forgatas__date__gte=start_date)
-                if end_date:
-                    assignments = assignments.filter(forgatas__date__lte=end_date)
-            
-            assignments = assignments.order_by('-created_at')
-            
-            response = []
-            for assignment in assignments:
-                response.append(create_beosztas_response(assignment))
-            
-            return 200, response
+            # Build queryset with every filter in one filter() call
+            try:
+                filters = get_assignment_list_filters(forgatas_id, kesz, start_date, end_date, stab_id)
+            except ValueError as e:
+                return 400, {"message": str(e)}
+            assignments = get_beosztas_queryset().filter(**filters).order_by('-created_at')
+            
+            # iterator() keeps only one chunk of model instances (and their
+            # prefetched relations) in memory next to the response dicts;
+            # users and roles shared by assignments are serialized once
+            user_responses, role_responses = {}, {}
+            response = [
+                create_beosztas_response(assignment, user_responses, role_responses)
+                for assignment in assignments.iterator(chunk_size=ASSIGNMENT_LIST_CHUNK_SIZE)
+            ]
+            
+            # Already in BeosztasSchema's shape; skip re-validating every row
+            # (see get_filming_assignments_with_availability)
+            return JsonResponse(response, safe=False)
         except Exception as e:
             return 500, {"message": f"Szerver hiba a beosztások lekérése során: {str(e)}"}
 
@@ -935,144 +936,13 @@ def register_assignment_endpoints(api):
             404: Assignment not found
             401: Authentication failed
         """
-        print(f"🔍 [DEBUG] Starting get_filming_assignment_details_by_forgatas for forgatas_id: {forgatas_id}")
-        
         try:
-            # Debug: Check if assignment exists
-            print(f"🔍 [DEBUG] Searching for Beosztas with forgatas_id: {forgatas_id}")
-            assignment = Beosztas.objects.select_related(
-                'forgatas', 'forgatas__szerkeszto', 'author', 'stab'
-            ).prefetch_related(
-                'szerepkor_relaciok__user',
-                'szerepkor_relaciok__szerepkor'
-            ).get(forgatas_id=forgatas_id)
-            
-            print(f"🔍 [DEBUG] Found assignment: ID={assignment.id}, kesz={assignment.kesz}")
-            print(f"🔍 [DEBUG] Assignment author: {assignment.author}")
-            print(f"🔍 [DEBUG] Assignment forgatas: {assignment.forgatas}")
-            
-            # Debug: Check forgatas details
-            if assignment.forgatas:
-                print(f"🔍 [DEBUG] Forgatas details: ID={assignment.forgatas.id}, name='{assignment.forgatas.name}', date={assignment.forgatas.date}")
-                print(f"🔍 [DEBUG] Forgatas times: {assignment.forgatas.timeFrom} - {assignment.forgatas.timeTo}")
-                print(f"🔍 [DEBUG] Forgatas type: {assignment.forgatas.forgTipus}")
-            else:
-                print(f"❌ [DEBUG] WARNING: Assignment has no forgatas!")
-            
-            # Debug: Check role relations
-            szerepkor_relaciok = assignment.szerepkor_relaciok.all()
-            print(f"🔍 [DEBUG] Found {len(szerepkor_relaciok)} role relations")
-            
-            for i, relacio in enumerate(szerepkor_relaciok):
-                print(f"🔍 [DEBUG] Role relation {i+1}: ID={relacio.id}")
-                print(f"🔍 [DEBUG]   User: ID={relacio.user.id}, username='{relacio.user.username}', name='{relacio.user.get_full_name()}'")
-                print(f"🔍 [DEBUG]   Szerepkor: ID={relacio.szerepkor.id}, name='{relacio.szerepkor.name}', ev={relacio.szerepkor.ev}")
-            
-            # Debug: Try to create response step by step
-            print(f"🔍 [DEBUG] Creating response...")
-            
-            # Test create_forgatas_basic_response
-            print(f"🔍 [DEBUG] Creating forgatas basic response...")
-            try:
-                forgatas_response = create_forgatas_basic_response(assignment.forgatas)
-                print(f"✅ [DEBUG] Forgatas response created successfully: {forgatas_response}")
-            except Exception as e:
-                print(f"❌ [DEBUG] Error in create_forgatas_basic_response: {str(e)}")
-                raise
-            
-            # Test create_user_basic_response for author
-            print(f"🔍 [DEBUG] Creating author response...")
-            try:
-                if assignment.author:
-                    author_response = create_user_basic_response(assignment.author)
-                    print(f"✅ [DEBUG] Author response created successfully: {author_response}")
-                else:
-                    print(f"🔍 [DEBUG] No author found, setting to None")
-                    author_response = None
-            except Exception as e:
-                print(f"❌ [DEBUG] Error in create_user_basic_response for author: {str(e)}")
-                raise
-            
-            # Test create_szerepkor_relacio_response for each relation
-            print(f"🔍 [DEBUG] Creating role relation responses...")
-            role_responses = []
-            try:
-                for i, relacio in enumerate(szerepkor_relaciok):
-                    print(f"🔍 [DEBUG] Processing role relation {i+1}...")
-                    
-                    # Test user response
-                    try:
-                        user_response = create_user_basic_response(relacio.user)
-                        print(f"✅ [DEBUG] User response for relation {i+1}: {user_response}")
-                    except Exception as e:
-                        print(f"❌ [DEBUG] Error creating user response for relation {i+1}: {str(e)}")
-                        raise
-                    
-                    # Test szerepkor response
-                    try:
-                        szerepkor_response = create_szerepkor_response(relacio.szerepkor)
-                        print(f"✅ [DEBUG] Szerepkor response for relation {i+1}: {szerepkor_response}")
-                    except Exception as e:
-                        print(f"❌ [DEBUG] Error creating szerepkor response for relation {i+1}: {str(e)}")
-                        raise
-                    
-                    # Test full relation response
-                    try:
-                        relacio_response = create_szerepkor_relacio_response(relacio)
-                        role_responses.append(relacio_response)
-                        print(f"✅ [DEBUG] Role relation response {i+1} created successfully")
-                    except Exception as e:
-                        print(f"❌ [DEBUG] Error creating role relation response {i+1}: {str(e)}")
-                        raise
-                        
-            except Exception as e:
-                print(f"❌ [DEBUG] Error processing role relations: {str(e)}")
-                raise
-            
-            # Test roles summary creation
-            print(f"🔍 [DEBUG] Creating roles summary...")
-            try:
-                roles_summary = {}
-                for relacio in szerepkor_relaciok:
-                    role_name = relacio.szerepkor.name
-                    if role_name not in roles_summary:
-                        roles_summary[role_name] = 0
-                    roles_summary[role_name] += 1
-                roles_summary_list = [{"role": role, "count": count} for role, count in roles_summary.items()]
-                print(f"✅ [DEBUG] Roles summary created: {roles_summary_list}")
-            except Exception as e:
-                print(f"❌ [DEBUG] Error creating roles summary: {str(e)}")
-                raise
-            
-            # Create full response
-            print(f"🔍 [DEBUG] Creating full response...")
-            try:
-                full_response = {
-                    "id": assignment.id,
-                    "forgatas": forgatas_response,
-                    "szerepkor_relaciok": role_responses,
-                    "kesz": assignment.kesz,
-                    "author": author_response,
-                    "created_at": assignment.created_at.isoformat(),
-                    "student_count": len(szerepkor_relaciok),
-                    "roles_summary": roles_summary_list
-                }
-                print(f"✅ [DEBUG] Full response created successfully")
-                print(f"🔍 [DEBUG] Response keys: {list(full_response.keys())}")
-                return 200, full_response
-            except Exception as e:
-                print(f"❌ [DEBUG] Error creating full response: {str(e)}")
-                raise
-                
+            assignment = get_beosztas_queryset().get(forgatas_id=forgatas_id)
+            return 200, create_beosztas_response(assignment)
         except Beosztas.DoesNotExist:
-            print(f"❌ [DEBUG] Beosztas not found for forgatas_id: {forgatas_id}")
             return 404, {"message": "Beosztás nem található"}
         except Exception as e:
-            print(f"❌ [DEBUG] Unexpected error in get_filming_assignment_details_by_forgatas: {str(e)}")
-            print(f"❌ [DEBUG] Error type: {type(e).__name__}")
-            import traceback
-            print(f"❌ [DEBUG] Full traceback:")
-            traceback.print_exc()
+            logger.exception("Failed to load assignment details for forgatas %s", forgatas_id)
             return 500, {"message": f"Szerver hiba a beosztás részletek lekérése során: {str(e)}"}
 
     @api.post("/assignments/filming-assignments", auth=JWTAuth(), response={201: BeosztasSchema, 400: ErrorSchema, 401: ErrorSchema})
@@ -1114,16 +984,14 @@ def register_assignment_endpoints(api):
                     return 400, {"message": "Stáb nem található"}
             
             # Check if assignment already exists for this forgatas
-            existing = Beosztas.objects.filter(forgatas=forgatas).first()
-            if existing:
-                return 400, {"message": f"Ehhez a forgatáshoz már létezik beosztás (ID: {existing.id})"}
+            existing_id = Beosztas.objects.filter(forgatas=forgatas).values_list('id', flat=True).first()
+            if existing_id:
+                return 400, {"message": f"Ehhez a forgatáshoz már létezik beosztás (ID: {existing_id})"}
             
             # Validate student-role pairs
             if not data.student_role_pairs:
                 return 400, {"message": "Legalább egy diák-szerepkör párosítás szükséges"}
             
-            assigned_users = []
-            
             with transaction.atomic():
                 # Create assignment
                 beosztas = Beosztas.objects.create(
@@ -1133,40 +1001,29 @@ def register_assignment_endpoints(api):
                     kesz=False
                 )
                 
-                # Create role relations
-                created_relations = []
+                # Look up every requested user and role with one query each
+                users = User.objects.in_bulk({pair["user_id"] for pair in data.student_role_pairs})
+                szerepkorok = Szerepkor.objects.in_bulk({pair["szerepkor_id"] for pair in data.student_role_pairs})
+                
+                # One relation per user: the first valid pair wins, invalid pairs are skipped
+                new_relations = {}
                 for pair in data.student_role_pairs:
-                    try:
-                        user = User.objects.get(id=pair["user_id"])
-                        szerepkor = Szerepkor.objects.get(id=pair["szerepkor_id"])
-                        
-                        # Check if this user is already assigned to this assignment
-                        existing_relation = SzerepkorRelaciok.objects.filter(
-                            user=user
-                        ).filter(
-                            beosztasok=beosztas
-                        ).first()
-                        
-                        if existing_relation:
-                            continue  # Skip duplicates
-                        
-                        relation = SzerepkorRelaciok.objects.create(
-                            user=user,
-                            szerepkor=szerepkor
-                        )
-                        beosztas.szerepkor_relaciok.add(relation)
-                        created_relations.append(relation)
-                        assigned_users.append(user)
-                        
-                    except (User.DoesNotExist, Szerepkor.DoesNotExist):
-                        continue  # Skip invalid pairs
+                    user = users.get(pair["user_id"])
+                    szerepkor = szerepkorok.get(pair["szerepkor_id"])
+                    if user is None or szerepkor is None or user.id in new_relations:
+                        continue
+                    new_relations[user.id] = SzerepkorRelaciok(user=user, szerepkor=szerepkor)
                 
-                if not created_relations:
+                if not new_relations:
                     return 400, {"message": "Egyetlen érvényes diák-szerepkör párosítás sem található"}
+                
+                # Create role relations
+                created_relations = SzerepkorRelaciok.objects.bulk_create(new_relations.values())
+                beosztas.szerepkor_relaciok.add(*created_relations)
             
             # Note: Email notifications are now handled automatically by model signals in models.py
             
-            return 201, create_beosztas_response(beosztas)
+            return 201, create_beosztas_response(get_beosztas_queryset().get(id=beosztas.id))
         except Exception as e:
             return 400, {"message": f"Error creating assignment: {str(e)}"}
 
@@ -1190,7 +1047,7 @@ def register_assignment_endpoints(api):
         """
         try:
             requesting_user = request.auth
-            beosztas = Beosztas.objects.get(id=assignment_id)
+            beosztas = get_beosztas_for_update(id=assignment_id)
             
             # Check admin or teacher permissions for Beosztás editing (same as creating)
             has_permission, error_message = check_admin_or_teacher_permissions(requesting_user)
@@ -1201,15 +1058,6 @@ def register_assignment_endpoints(api):
             if beosztas.kesz and data.kesz != True:
                 return 400, {"message": "Véglegesített beosztást nem lehet módosítani"}
             
-            # Track users for email notifications
-            old_users = set()
-            new_users = set()
-            
-            # Get current users before changes
-            if data.student_role_pairs is not None:
-                for relation in beosztas.szerepkor_relaciok.all():
-                    old_users.add(relation.user)
-            
             with transaction.atomic():
                 # Update stab if provided
                 if data.stab_id is not None:
@@ -1224,41 +1072,58 @@ def register_assignment_endpoints(api):
                 
                 # Update student-role pairs if provided
                 if data.student_role_pairs is not None:
-                    # Remove existing relations
-                    for relation in beosztas.szerepkor_relaciok.all():
-                        beosztas.szerepkor_relaciok.remove(relation)
-                        relation.delete()
+                    # Look up every requested user and role with one query each
+                    users = User.objects.in_bulk({pair["user_id"] for pair in data.student_role_pairs})
+                    szerepkorok = Szerepkor.objects.in_bulk({pair["szerepkor_id"] for pair in data.student_role_pairs})
                     
-                    # Add new relations
-                    for pair in data.student_role_pairs:
-                        try:
-                            user = User.objects.get(id=pair["user_id"])
-                            szerepkor = Szerepkor.objects.get(id=pair["szerepkor_id"])
-                            
-                            relation = SzerepkorRelaciok.objects.create(
-                                user=user,
-                                szerepkor=szerepkor
-                            )
-                            beosztas.szerepkor_relaciok.add(relation)
-                            new_users.add(user)
-                            
-                        except (User.DoesNotExist, Szerepkor.DoesNotExist):
-                            continue  # Skip invalid pairs
+                    # Requested (user, role) pairs in request order, invalid pairs skipped
+                    requested_pairs = dict.fromkeys(
+                        (pair["user_id"], pair["szerepkor_id"])
+                        for pair in data.student_role_pairs
+                        if pair["user_id"] in users and pair["szerepkor_id"] in szerepkorok
+                    )
+                    
+                    existing_relations = defaultdict(list)
+                    for relation_id, user_id, szerepkor_id in beosztas.szerepkor_relaciok.values_list(
+                        'id', 'user_id', 'szerepkor_id'
+                    ):
+                        existing_relations[(user_id, szerepkor_id)].append(relation_id)
+                    
+                    # Only touch the relations that changed: drop pairs no longer
+                    # requested (and duplicates of kept ones), add the new pairs.
+                    # A single remove() / add() keeps the m2m signals (absences,
+                    # notification emails) to one batch each.
+                    removed_relation_ids = [
+                        relation_id
+                        for key, relation_ids in existing_relations.items()
+                        for relation_id in (relation_ids[1:] if key in requested_pairs else relation_ids)
+                    ]
+                    if removed_relation_ids:
+                        beosztas.szerepkor_relaciok.remove(*removed_relation_ids)
+                        SzerepkorRelaciok.objects.filter(id__in=removed_relation_ids).delete()
+                    
+                    new_relations = [
+                        SzerepkorRelaciok(user=users[user_id], szerepkor=szerepkorok[szerepkor_id])
+                        for user_id, szerepkor_id in requested_pairs
+                        if (user_id, szerepkor_id) not in existing_relations
+                    ]
+                    if new_relations:
+                        beosztas.szerepkor_relaciok.add(*SzerepkorRelaciok.objects.bulk_create(new_relations))
                 
                 # Update completion status
                 if data.kesz is not None:
                     beosztas.kesz = data.kesz
                     beosztas.save()
-                    
-                    # If finalizing, create absences
-                    if data.kesz:
-                        auto_create_absences_for_beosztas(beosztas)
                 else:
                     beosztas.save()  # Save the stab changes
             
+            # If finalizing, create absences once the changes above are committed
+            if data.kesz:
+                auto_create_absences_for_beosztas(beosztas)
+            
             # Note: Email notifications for user changes are now handled automatically by model signals in models.py
             
-            return 200, create_beosztas_response(beosztas)
+            return 200, create_beosztas_response(get_beosztas_queryset().get(id=beosztas.id))
         except Beosztas.DoesNotExist:
             return 404, {"message": "Beosztás nem található"}
         except Exception as e:
@@ -1282,27 +1147,28 @@ def register_assignment_endpoints(api):
         """
         try:
             requesting_user = request.auth
-            beosztas = Beosztas.objects.get(id=assignment_id)
-            
-            # Check permissions
-            if not can_user_manage_beosztas(requesting_user, beosztas):
-                return 401, {"message": "Nincs jogosultság a beosztás véglegesítéséhez"}
-            
-            # Get assigned users before finalizing
-            assigned_users = []
-            for relation in beosztas.szerepkor_relaciok.all():
-                assigned_users.append(relation.user)
-            
             with transaction.atomic():
-                beosztas.kesz = True
-                beosztas.save()
+                # A concurrent finalize waits for this lock, then sees kesz=True
+                beosztas = get_beosztas_for_update(lock=True, id=assignment_id)
                 
-                # Create absences for all assigned students
-                auto_create_absences_for_beosztas(beosztas)
+                # Check permissions
+                if not can_user_manage_beosztas(requesting_user, beosztas):
+                    return 401, {"message": "Nincs jogosultság a beosztás véglegesítéséhez"}
+                
+                # Already finalized (e.g. a retried request): nothing to save, no emails
+                if not beosztas.kesz:
+                    beosztas.kesz = True
+                    beosztas.save(update_fields=['kesz', 'tanev'])
+            
+            # Create absences for all assigned students in a separate, short
+            # transaction so the assignment's rows are not locked meanwhile.
+            # Also runs on a repeated finalize: the helper only creates the
+            # missing absences, so a retry backfills what an earlier attempt lost.
+            auto_create_absences_for_beosztas(beosztas)
             
             # Note: Email notifications for finalization are now handled automatically by model signals in models.py
             
-            return 200, create_beosztas_response(beosztas)
+            return 200, create_beosztas_response(get_beosztas_queryset().get(id=beosztas.id))
         except Beosztas.DoesNotExist:
             return 404, {"message": "Beosztás nem található"}
         except Exception as e:
@@ -1328,29 +1194,27 @@ def register_assignment_endpoints(api):
             requesting_user = request.auth
             
             # Check admin permissions (stricter than finalize)
-            try:
-                from api.models import Profile
-                profile = Profile.objects.get(user=requesting_user)
-                if not profile.has_admin_permission('any'):
-                    return 401, {"message": "Adminisztrátor jogosultság szükséges"}
-            except Profile.DoesNotExist:
+            profile = getattr(requesting_user, 'profile', None)
+            if profile is None:
                 return 401, {"message": "Felhasználói profil nem található"}
-            
-            beosztas = Beosztas.objects.get(id=assignment_id)
-            
-            # Get assigned users before marking as done
-            assigned_users = []
-            for relation in beosztas.szerepkor_relaciok.all():
-                assigned_users.append(relation.user)
+            if not profile.has_admin_permission('any'):
+                return 401, {"message": "Adminisztrátor jogosultság szükséges"}
             
             with transaction.atomic():
-                beosztas.kesz = True
-                beosztas.save()
+                # A concurrent mark-done waits for this lock, then sees kesz=True
+                beosztas = get_beosztas_for_update(lock=True, id=assignment_id)
                 
-                # Create absences for all assigned students
-                auto_create_absences_for_beosztas(beosztas)
+                # Already done: nothing to save, no emails
+                if not beosztas.kesz:
+                    beosztas.kesz = True
+                    beosztas.save(update_fields=['kesz', 'tanev'])
             
-            return 200, create_beosztas_response(beosztas)
+            # Create absences for all assigned students in a separate, short
+            # transaction so the assignment's rows are not locked meanwhile
+            # (missing ones only, so a repeated mark-done backfills them too)
+            auto_create_absences_for_beosztas(beosztas)
+            
+            return 200, create_beosztas_response(get_beosztas_queryset().get(id=beosztas.id))
         except Beosztas.DoesNotExist:
             return 404, {"message": "Beosztás nem található"}
         except Exception as e:
@@ -1376,25 +1240,27 @@ def register_assignment_endpoints(api):
             requesting_user = request.auth
             
             # Check admin permissions
-            try:
-                from api.models import Profile
-                profile = Profile.objects.get(user=requesting_user)
-                if not profile.has_admin_permission('any'):
-                    return 401, {"message": "Adminisztrátor jogosultság szükséges"}
-            except Profile.DoesNotExist:
+            profile = getattr(requesting_user, 'profile', None)
+            if profile is None:
                 return 401, {"message": "Felhasználói profil nem található"}
+            if not profile.has_admin_permission('any'):
+                return 401, {"message": "Adminisztrátor jogosultság szükséges"}
             
-            beosztas = Beosztas.objects.get(id=assignment_id)
+            beosztas = get_beosztas_for_update(id=assignment_id)
+            
+            # Already a draft: nothing to save or clean up
+            if not beosztas.kesz:
+                return 200, create_beosztas_response(get_beosztas_queryset().get(id=beosztas.id))
             
             with transaction.atomic():
                 beosztas.kesz = False
-                beosztas.save()
+                beosztas.save(update_fields=['kesz', 'tanev'])
                 
                 # Remove auto-created absences for this assignment
                 # Note: This calls the clean_absence_records method which removes auto-created absences
                 beosztas.clean_absence_records()
             
-            return 200, create_beosztas_response(beosztas)
+            return 200, create_beosztas_response(get_beosztas_queryset().get(id=beosztas.id))
         except Beosztas.DoesNotExist:
             return 404, {"message": "Beosztás nem található"}
         except Exception as e:
@@ -1418,30 +1284,28 @@ def register_assignment_endpoints(api):
         """
         try:
             requesting_user = request.auth
-            beosztas = Beosztas.objects.get(id=assignment_id)
-            
-            # Check admin or teacher permissions for Beosztás deletion (same as creating)
-            has_permission, error_message = check_admin_or_teacher_permissions(requesting_user)
-            if not has_permission:
-                return 401, {"message": error_message}
             
             with transaction.atomic():
+                # Lock the assignment so the counts below match what gets deleted
+                beosztas = Beosztas.objects.select_related('forgatas').select_for_update(of=('self',)).get(id=assignment_id)
+                
+                # Check admin or teacher permissions for Beosztás deletion (same as creating)
+                has_permission, error_message = check_admin_or_teacher_permissions(requesting_user)
+                if not has_permission:
+                    return 401, {"message": error_message}
+                
                 # Get info for response
                 forgatas_name = beosztas.forgatas.name if beosztas.forgatas else "N/A"
-                student_count = beosztas.szerepkor_relaciok.count()
+                student_ids = list(beosztas.szerepkor_relaciok.values_list('user_id', flat=True))
+                student_count = len(student_ids)
                 
                 # Delete associated absences if finalized
                 if beosztas.kesz and beosztas.forgatas:
-                    student_ids = [rel.user.id for rel in beosztas.szerepkor_relaciok.all()]
-                    deleted_absences = Absence.objects.filter(
-                        forgatas=beosztas.forgatas,
-                        diak_id__in=student_ids
-                    ).count()
-                    
-                    Absence.objects.filter(
+                    _, deleted_per_model = Absence.objects.filter(
                         forgatas=beosztas.forgatas,
                         diak_id__in=student_ids
                     ).delete()
+                    deleted_absences = deleted_per_model.get(Absence._meta.label, 0)
                 else:
                     deleted_absences = 0
                 
@@ -1539,77 +1403,84 @@ def register_assignment_endpoints(api):
             
             user = User.objects.get(id=user_id)
             
-            # Get all role relations for this user
+            # Get all role relations for this user (also the ones not in any assignment)
             role_relations = SzerepkorRelaciok.objects.filter(user=user).select_related('szerepkor')
             
-            # Get all assignments where this user participated
-            assignments = Beosztas.objects.filter(
-                szerepkor_relaciok__user=user
-            ).select_related('forgatas').order_by('-created_at')
+            # Every (role relation, assignment) pair of the user in one query,
+            # most recently created assignment first
+            assignments_by_relation = defaultdict(list)
+            for row in Beosztas.szerepkor_relaciok.through.objects.filter(
+                szerepkorrelaciok__user=user
+            ).values(
+                'szerepkorrelaciok_id', 'beosztas_id', 'beosztas__kesz', 'beosztas__created_at',
+                'beosztas__forgatas_id', 'beosztas__forgatas__name', 'beosztas__forgatas__date',
+                'beosztas__forgatas__forgTipus'
+            ).order_by('-beosztas__created_at'):
+                assignments_by_relation[row['szerepkorrelaciok_id']].append(row)
             
             # Build role statistics
             role_stats = {}
+            last_dates = {}  # Date of each role's last_forgatas, for comparison
+            forgatas_responses = {}  # Forgatas blocks by id, shared by every role that used the forgatas
             
             for relation in role_relations:
-                role_name = relation.szerepkor.name
-                role_id = relation.szerepkor.id
+                role_id = relation.szerepkor_id
                 
                 if role_id not in role_stats:
                     role_stats[role_id] = {
                         "role": create_szerepkor_response(relation.szerepkor),
                         "total_times": 0,
                         "last_time": None,
-                        "last_date": None,  # Track date object for comparison
                         "last_forgatas": None,
                         "assignments": []
                     }
                 
                 # Count how many assignments used this role relation
-                related_assignments = assignments.filter(szerepkor_relaciok=relation)
-                role_stats[role_id]["total_times"] += related_assignments.count()
+                related_assignments = assignments_by_relation[relation.id]
+                role_stats[role_id]["total_times"] += len(related_assignments)
                 
-                # Find the most recent assignment
-                latest_assignment = related_assignments.first()
-                if latest_assignment and latest_assignment.forgatas:
-                    # Store the last_time as a date object for comparison, convert to string only when needed
-                    current_date = latest_assignment.forgatas.date
-                    stored_last_date = role_stats[role_id].get("last_date")  # We'll track this separately
+                # Add assignment details for this role; the latest forgatas date becomes last_forgatas
+                for assignment in related_assignments:
+                    if not assignment['beosztas__forgatas_id']:
+                        continue
+                    
+                    forgatas_id = assignment['beosztas__forgatas_id']
+                    forgatas_response = forgatas_responses.get(forgatas_id)
+                    if forgatas_response is None:
+                        forgatas_response = forgatas_responses[forgatas_id] = {
+                            "id": forgatas_id,
+                            "name": assignment['beosztas__forgatas__name'],
+                            "date": assignment['beosztas__forgatas__date'].isoformat(),
+                            "type": assignment['beosztas__forgatas__forgTipus']
+                        }
+                    
+                    forgatas_date = assignment['beosztas__forgatas__date']
+                    stored_last_date = last_dates.get(role_id)
                     
-                    if (not stored_last_date or current_date > stored_last_date):
-                        role_stats[role_id]["last_date"] = current_date  # Store date object for comparison
-                        role_stats[role_id]["last_time"] = current_date.isoformat()  # Store string for response
+                    if (not stored_last_date or forgatas_date > stored_last_date):
+                        last_dates[role_id] = forgatas_date
+                        role_stats[role_id]["last_time"] = forgatas_response["date"]
                         role_stats[role_id]["last_forgatas"] = {
-                            "id": latest_assignment.forgatas.id,
-                            "name": latest_assignment.forgatas.name,
-                            "date": current_date.isoformat()
+                            "id": forgatas_id,
+                            "name": forgatas_response["name"],
+                            "date": forgatas_response["date"]
                         }
-                
-                # Add assignment details for this role
-                for assignment in related_assignments:
-                    if assignment.forgatas:
-                        role_stats[role_id]["assignments"].append({
-                            "assignment_id": assignment.id,
-                            "forgatas": {
-                                "id": assignment.forgatas.id,
-                                "name": assignment.forgatas.name,
-                                "date": assignment.forgatas.date.isoformat(),
-                                "type": assignment.forgatas.forgTipus
-                            },
-                            "finalized": assignment.kesz,
-                            "created_at": assignment.created_at.isoformat()
-                        })
+                    
+                    role_stats[role_id]["assignments"].append({
+                        "assignment_id": assignment['beosztas_id'],
+                        "forgatas": forgatas_response,
+                        "finalized": assignment['beosztas__kesz'],
+                        "created_at": assignment['beosztas__created_at'].isoformat()
+                    })
             
             # Convert to list and sort by total times (most used roles first)
             role_statistics = list(role_stats.values())
             role_statistics.sort(key=lambda x: x["total_times"], reverse=True)
             
-            # Clean up internal fields before sending response
-            for role_stat in role_statistics:
-                if "last_date" in role_stat:
-                    del role_stat["last_date"]  # Remove internal field used for comparison
-            
             # Calculate summary statistics
-            total_assignments = assignments.count()
+            total_assignments = len({
+                row['beosztas_id'] for rows in assignments_by_relation.values() for row in rows
+            })
             total_roles_used = len(role_statistics)
             most_used_role = role_statistics[0] if role_statistics else None
             
@@ -1659,7 +1530,7 @@ def register_assignment_endpoints(api):
             
             return 200, {
                 "grouped_roles": list(grouped_roles.values()),
-                "total_roles": roles.count()
+                "total_roles": len(roles)
             }
         except Exception as e:
             return 401, {"message": f"Error fetching grouped roles: {str(e)}"}
@@ -1680,13 +1551,13 @@ def register_assignment_endpoints(api):
             401: Authentication failed
         """
         try:
-            beosztas = Beosztas.objects.get(id=assignment_id)
+            beosztas = Beosztas.objects.select_related('forgatas').get(id=assignment_id)
             
             if not beosztas.kesz or not beosztas.forgatas:
                 return 200, []  # No absences if not finalized or no forgatas
             
-            # Get student IDs from assignment
-            student_ids = [rel.user.id for rel in beosztas.szerepkor_relaciok.all()]
+            # Get student IDs from assignment (evaluated as a subquery of the absence query)
+            student_ids = beosztas.szerepkor_relaciok.values_list('user_id', flat=True)
             
             # Find absences for these students and this forgatas
             absences = Absence.objects.filter(
@@ -1714,9 +1585,10 @@ def register_assignment_endpoints(api):
         except Exception as e:
             return 401, {"message": f"Error fetching assignment absences: {str(e)}"}
 
-    @api.get("/assignments/filming-assignments-with-availability", auth=JWTAuth(), response={200: List[BeosztasWithAvailabilitySchema], 401: ErrorSchema})
+    @api.get("/assignments/filming-assignments-with-availability", auth=JWTAuth(), response={200: List[BeosztasWithAvailabilitySchema], 400: ErrorSchema, 401: ErrorSchema})
     def get_filming_assignments_with_availability(request, forgatas_id: int = None, kesz: bool = None, 
-                                                 start_date: str = None, end_date: str = None, stab_id: int = None):
+                                                 start_date: str = None, end_date: str = None, stab_id: int = None,
+                                                 limit: int = None, offset: int = 0):
         """
         Get filming assignments with detailed user availability information.
         
@@ -1731,45 +1603,47 @@ def register_assignment_endpoints(api):
             start_date: Optional start date filter for associated filming sessions
             end_date: Optional end date filter for associated filming sessions
             stab_id: Optional filter by stab ID
+            limit: Optional page size; when given, only this many assignments are returned
+                   and the total number of matches is sent in the X-Total-Count header
+            offset: Number of assignments to skip before the page (used with limit)
             
         Returns:
             200: List of assignments with availability data
+            400: Invalid date format or paging parameters
             401: Authentication failed
         """
         try:
             requesting_user = request.auth
             
-            # Build queryset
-            assignments = Beosztas.objects.select_related(
-                'forgatas', 'forgatas__szerkeszto', 'author', 'stab'
-            ).prefetch_related(
-                'szerepkor_relaciok__user',
-                'szerepkor_relaciok__szerepkor'
-            ).all()
-            
-            # Apply filters
-            if forgatas_id:
-                assignments = assignments.filter(forgatas_id=forgatas_id)
-            
-            if kesz is not None:
-                assignments = assignments.filter(kesz=kesz)
-            
-            if stab_id:
-                assignments = assignments.filter(stab_id=stab_id)
-            
-            if start_date or end_date:
-                if start_date:
-                    assignments = assignments.filter(forgatas__date__gte=start_date)
-                if end_date:
-                    assignments = assignments.filter(forgatas__date__lte=end_date)
-            
-            assignments = assignments.order_by('-created_at')
-            
-            response = []
-            for assignment in assignments:
-                response.append(create_beosztas_with_availability_response(assignment))
-            
-            return 200, response
+            # Build queryset with every filter in one filter() call
+            try:
+                filters = get_assignment_list_filters(forgatas_id, kesz, start_date, end_date, stab_id)
+            except ValueError as e:
+                return 400, {"message": str(e)}
+            assignments = get_beosztas_queryset().filter(**filters).order_by('-created_at')
+            
+            # Availability is computed for every student of every returned
+            # assignment, so large lists can be fetched page by page
+            total_count = None
+            if limit is not None:
+                if limit < 1 or offset < 0:
+                    return 400, {"message": "A limit legalább 1, az offset nem lehet negatív"}
+                total_count = assignments.count()
+                assignments = assignments[offset:offset + limit]
+            
+            # The builder already returns the schema's shape; validating every
+            # nested availability entry again took most of the response time.
+            # Entries are streamed as they are built, so the whole list is never
+            # held in memory; an error in the first entry still ends up in the
+            # except below (see stream_json_list).
+            user_responses, role_responses = {}, {}
+            streaming_response = stream_json_list(
+                create_beosztas_with_availability_response(assignment, user_responses, role_responses)
+                for assignment in assignments.iterator(chunk_size=ASSIGNMENT_LIST_CHUNK_SIZE)
+            )
+            if total_count is not None:
+                streaming_response['X-Total-Count'] = str(total_count)
+            return streaming_response
         except Exception as e:
             return 401, {"message": f"Error fetching assignments with availability: {str(e)}"}
 
@@ -1792,14 +1666,10 @@ def register_assignment_endpoints(api):
             401: Authentication failed
         """
         try:
-            assignment = Beosztas.objects.select_related(
-                'forgatas', 'forgatas__szerkeszto', 'author', 'stab'
-            ).prefetch_related(
-                'szerepkor_relaciok__user',
-                'szerepkor_relaciok__szerepkor'
-            ).get(forgatas_id=forgatas_id)
-
-            return 200, create_beosztas_with_availability_response(assignment)
+            assignment = get_beosztas_queryset().get(forgatas_id=forgatas_id)
+
+            # Already in the schema's shape, see get_filming_assignments_with_availability
+            return JsonResponse(create_beosztas_with_availability_response(assignment))
         except Beosztas.DoesNotExist:
             return 404, {"message": "Beosztás nem található"}
         except Exception as e:
@@ -1867,7 +1737,6 @@ def register_assignment_endpoints(api):
                 return 400, {"message": "A felhasználóhoz nincs email cím rendelve"}
             
             # Find a suitable test forgatas (future or recent)
-            from datetime import date, timedelta
             recent_date = date.today() - timedelta(days=7)
             future_date = date.today() + timedelta(days=30)
             
@@ -1887,22 +1756,13 @@ def register_assignment_endpoints(api):
                     forgTipus="teszt"
                 )
             
-            # Create mock availability data for testing
-            mock_availability_data = {
-                "users_available": [
-                    {
-                        "user": create_user_basic_response(requesting_user),
-                        "availability": check_user_availability_for_forgatas(requesting_user, test_forgatas)
-                    }
-                ],
-                "users_on_vacation": [],
-                "users_with_radio_session": [],
-                "summary": {
-                    "total_users": 1,
-                    "available_count": 1,
-                    "vacation_count": 0,
-                    "radio_session_count": 0
-                }
+            # Mock availability summary for testing; the real availability check
+            # is not run until the email sending below is implemented
+            mock_availability_summary = {
+                "total_users": 1,
+                "available_count": 1,
+                "vacation_count": 0,
+                "radio_session_count": 0
             }
             
             # Note: Email sending logic would go here
@@ -1912,7 +1772,7 @@ def register_assignment_endpoints(api):
                 "message": f"Teszt elérhetőség email sikeresen elküldve a következő címre: {requesting_user.email}",
                 "email": requesting_user.email,
                 "forgatas_name": test_forgatas.name,
-                "availability_summary": mock_availability_data["summary"],
+                "availability_summary": mock_availability_summary,
                 "test_time": datetime.now().isoformat()
             }
                 
@@ -1944,7 +1804,6 @@ def register_assignment_endpoints(api):
                 return 400, {"message": "A felhasználóhoz nincs email cím rendelve"}
             
             # Find a suitable test forgatas (future or recent)
-            from datetime import date, timedelta
             recent_date = date.today() - timedelta(days=7)
             future_date = date.today() + timedelta(days=30)
             
@@ -1965,8 +1824,6 @@ def register_assignment_endpoints(api):
                 )
             
             # Send test assignment change email
-            from .authentication import send_assignment_change_notification_email
-            
             success = send_assignment_change_notification_email(
                 test_forgatas,
                 [requesting_user],  # added users
@@ -2002,26 +1859,34 @@ def register_assignment_endpoints(api):
             401: Authentication failed
         """
         try:
-            # Count assignments
-            total_assignments = Beosztas.objects.count()
-            finalized_assignments = Beosztas.objects.filter(kesz=True).count()
+            summary = cache.get(ASSIGNMENTS_SUMMARY_CACHE_KEY)
+            if summary is not None:
+                return 200, summary
+            
+            # Count assignments (both counts in one aggregate query)
+            assignment_counts = Beosztas.objects.aggregate(
+                total=Count('id'),
+                finalized=Count('id', filter=Q(kesz=True))
+            )
+            total_assignments = assignment_counts['total']
+            finalized_assignments = assignment_counts['finalized']
             pending_assignments = total_assignments - finalized_assignments
             
             # Count roles and role relations
             total_roles = Szerepkor.objects.count()
             total_role_relations = SzerepkorRelaciok.objects.count()
             
-            # Get role usage statistics
-            role_usage = {}
-            for role in Szerepkor.objects.all():
-                usage_count = SzerepkorRelaciok.objects.filter(szerepkor=role).count()
-                role_usage[role.name] = usage_count
-            
-            # Sort roles by usage
-            most_used_roles = sorted(role_usage.items(), key=lambda x: x[1], reverse=True)[:5]
-            
-            # Get recent activity
-            recent_assignments = Beosztas.objects.order_by('-created_at')[:5]
+            # Get the most used roles (relations counted per role in one GROUP BY query)
+            most_used_roles = Szerepkor.objects.annotate(
+                usage_count=Count('szerepkorrelaciok')
+            ).order_by('-usage_count', 'name').values_list('name', 'usage_count')[:5]
+            
+            # Get recent activity (only the columns the activity entries use)
+            recent_assignments = Beosztas.objects.select_related('forgatas').only(
+                'id', 'kesz', 'created_at', 'forgatas__name'
+            ).annotate(
+                student_count=Count('szerepkor_relaciok')
+            ).order_by('-created_at')[:5]
             recent_activity = []
             for assignment in recent_assignments:
                 recent_activity.append({
@@ -2029,19 +1894,19 @@ def register_assignment_endpoints(api):
                     "forgatas_name": assignment.forgatas.name if assignment.forgatas else "N/A",
                     "created_at": assignment.created_at.isoformat(),
                     "finalized": assignment.kesz,
-                    "student_count": assignment.szerepkor_relaciok.count()
+                    "student_count": assignment.student_count
                 })
             
-            # Count assignments by forgatas type
-            forgatas_type_stats = {}
-            for assignment in Beosztas.objects.select_related('forgatas').all():
-                if assignment.forgatas:
-                    forg_type = assignment.forgatas.forgTipus
-                    if forg_type not in forgatas_type_stats:
-                        forgatas_type_stats[forg_type] = 0
-                    forgatas_type_stats[forg_type] += 1
+            # Count assignments by forgatas type (GROUP BY in the database)
+            forgatas_type_stats = {
+                row['forgatas__forgTipus']: row['count']
+                for row in Beosztas.objects.filter(forgatas__isnull=False)
+                .values('forgatas__forgTipus')
+                .annotate(count=Count('id'))
+                .order_by('forgatas__forgTipus')
+            }
             
-            return 200, {
+            summary = {
                 "assignment_stats": {
                     "total_assignments": total_assignments,
                     "finalized_assignments": finalized_assignments,
@@ -2058,6 +1923,9 @@ def register_assignment_endpoints(api):
                 "recent_activity": recent_activity,
                 "generated_at": datetime.now().isoformat()
             }
+            cache.set(ASSIGNMENTS_SUMMARY_CACHE_KEY, summary, ASSIGNMENTS_SUMMARY_CACHE_TIMEOUT)
+            
+            return 200, summary
             
         except Exception as e:
             return 401, {"message": f"Error generating summary: {str(e)}"}
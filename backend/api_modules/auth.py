@@ -85,7 +85,9 @@ class JWTAuth(HttpBearer):
             
             user_id = payload.get("user_id")
             if user_id:
-                user = User.objects.get(id=user_id)
+                # A profilt (és az osztályt) egy lekérdezésben töltjük be: a
+                # jogosultság-ellenőrzések a request.auth.profile-t használják.
+                user = User.objects.select_related('profile__osztaly').get(id=user_id)
                 if not user.is_active:  # Check if user is active
                     print(f"User {user.username} is not active")  # Debug
                     return None
@@ -170,7 +172,8 @@ def is_user_allowed_for_current_tanev(user: User) -> tuple[bool, str]:
 
     # Adminisztrátorok/tanárok/osztályfőnökök szintén mindig beléphetnek.
     try:
-        profile = Profile.objects.select_related('osztaly').get(user=user)
+        # JWTAuth már select_related-del betöltötte, ilyenkor nincs új lekérdezés.
+        profile = user.profile
     except Profile.DoesNotExist:
         # Nincs profil -> nem diák, engedjük bejelentkezni (pl. új admin).
         return True, ""
@@ -186,7 +189,7 @@ def is_user_allowed_for_current_tanev(user: User) -> tuple[bool, str]:
         # korlátozást, ezért a régi viselkedést tartjuk és engedjük belépni.
         return True, ""
 
-    if profile.osztaly is None:
+    if profile.osztaly_id is None:
         return False, (
             "A felhasználó nincs osztályhoz rendelve, ezért az aktuális tanévben "
             "nem jelentkezhet be. Fordulj a médiatanárhoz."
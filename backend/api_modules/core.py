@@ -120,11 +120,17 @@ All endpoints return structured JSON responses with:
 """
 
 from datetime import datetime
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
 from ninja import Schema
 from ninja.errors import HttpError
 from .auth import JWTAuth, ErrorSchema
 from api.models import Profile
 from typing import Optional
+import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Permission Schemas
@@ -660,6 +666,52 @@ def register_core_endpoints(api):
 # Utility Functions
 # ============================================================================
 
+def stream_json_list(items) -> StreamingHttpResponse:
+    """
+    Stream a JSON array of response items row by row.
+    
+    Used by list endpoints that can return many rows: the first bytes are
+    sent before the whole list is built, and memory use does not grow with
+    the number of rows.
+    
+    The first item is built before the response is returned, so an error in
+    it (or in the query behind the iterable) still reaches the endpoint's own
+    error handling. Once streaming has started the status code cannot change:
+    a later error is logged and re-raised, which aborts the response instead
+    of ending it as a well-formed but incomplete array.
+    
+    Args:
+        items: Iterable of Schema instances or plain dicts already in the
+               schema's shape (e.g. a generator over a queryset); dicts are
+               encoded the same way JsonResponse does
+        
+    Returns:
+        StreamingHttpResponse with an application/json body
+    """
+    def encode(item) -> str:
+        if isinstance(item, Schema):
+            return item.model_dump_json()
+        return json.dumps(item, cls=DjangoJSONEncoder)
+    
+    items = iter(items)
+    first = next(items, None)
+    first_json = encode(first) if first is not None else None
+    
+    def generate():
+        if first_json is None:
+            yield "[]"
+            return
+        yield "[" + first_json
+        try:
+            for item in items:
+                yield "," + encode(item)
+        except Exception:
+            logger.exception("Streaming a JSON list response failed after it was started")
+            raise
+        yield "]"
+    
+    return StreamingHttpResponse(generate(), content_type="application/json")
+
 def format_error_response(message: str, code: str = None) -> dict:
     """
     Create standardized error response.
@@ -2,6 +2,15 @@ DJANGO_SECRET_KEY = 'your-secret-key-here'
 DJANGO_DEBUG = True
 DJANGO_ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
 
+# Database connection reuse (seconds, 0 = new connection per request, None = unlimited)
+DJANGO_CONN_MAX_AGE = 60
+
+# Shared cache directory (all Gunicorn workers must use the same one)
+# DJANGO_CACHE_LOCATION = '/var/tmp/ftv_cache'
+
+# Log level of the api / backend loggers ('DEBUG' shows the absence and email signal traces)
+DJANGO_LOG_LEVEL = 'INFO'
+
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 from pathlib import Path
+import sys
 import local_settings  # Import local settings for sensitive data
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -108,10 +109,38 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Persistent connections: a kapcsolatot kérések között újrahasznosítjuk,
+        # így nem kell minden kérésnél új kapcsolatot felépíteni.
+        'CONN_MAX_AGE': getattr(local_settings, 'DJANGO_CONN_MAX_AGE', 60),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Cache
+# Gunicorn runs several worker processes. A per-process cache (Django's default
+# LocMemCache) would only be invalidated in the worker that handled a save, the
+# others would keep serving the stale value, so the cache is shared: the file
+# based backend is visible to every process on the host without an extra
+# service. Point DJANGO_CACHE_LOCATION at a directory the server can write.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': getattr(local_settings, 'DJANGO_CACHE_LOCATION', BASE_DIR / 'cache'),
+    }
+}
+
+# The test runner rolls back the database after every test without sending
+# delete signals, so it must not share the file cache with the dev server:
+# each test process gets its own in-memory cache instead.
+if len(sys.argv) > 1 and sys.argv[1] == 'test':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -174,3 +203,26 @@ DEFAULT_FROM_EMAIL = getattr(local_settings, 'DEFAULT_FROM_EMAIL')
 
 # Password Reset Settings
 PASSWORD_RESET_TIMEOUT = getattr(local_settings, 'PASSWORD_RESET_TIMEOUT', 3600)  # 1 hour
+
+# Logging
+# The api and backend modules log their debug traces at DEBUG level; set
+# DJANGO_LOG_LEVEL = 'DEBUG' in local_settings to see them.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'api': {
+            'handlers': ['console'],
+            'level': getattr(local_settings, 'DJANGO_LOG_LEVEL', 'INFO'),
+        },
+        'backend': {
+            'handlers': ['console'],
+            'level': getattr(local_settings, 'DJANGO_LOG_LEVEL', 'INFO'),
+        },
+    },
+}
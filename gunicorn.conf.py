@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for the FTV backend.
+
+Gunicorn picks this file up automatically when started from the project root:
+    gunicorn backend.wsgi:application
+
+The API is I/O bound (most of the request time is spent waiting for the
+database), so every worker process serves several requests concurrently with
+threads. Each thread keeps its own persistent database connection
+(see CONN_MAX_AGE in settings.py).
+
+The defaults are deliberately small:
+
+- The database is SQLite, which allows only one writer at a time. Every
+  thread is a potential concurrent writer; many of them do not add
+  throughput, they end in "database is locked" errors.
+- Cached values (active school year, assignment summary) have to be shared
+  by all workers, otherwise a save handled by one worker leaves the others
+  serving stale data. settings.CACHES uses a file based cache for this;
+  do not switch it to the per-process LocMemCache while running more than
+  one worker.
+
+Raise GUNICORN_WORKERS / GUNICORN_THREADS only after moving to a database
+server (e.g. PostgreSQL).
+"""
+
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '127.0.0.1:8000')
+
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+
+timeout = 60
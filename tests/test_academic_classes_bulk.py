@@ -0,0 +1,111 @@
+"""
+Behaviour tests for POST /api/classes/bulk.
+
+The endpoint validates every item first and creates the classes (and their
+school year links) in one transaction, so a batch is created either fully
+or not at all.
+
+Run with:
+    python manage.py test tests.test_academic_classes_bulk
+"""
+
+import json
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.test import TestCase, Client
+
+from api.models import Profile, Tanev, Osztaly
+from backend.api_modules.auth import generate_jwt_token
+
+
+class ClassesBulkCreateTests(TestCase):
+    """POST /api/classes/bulk"""
+
+    url = '/api/classes/bulk'
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user('bulk_admin', password='bulk-pass')
+        Profile.objects.create(user=self.admin, admin_type='system_admin')
+        self.client = Client(HTTP_AUTHORIZATION=f'Bearer {generate_jwt_token(self.admin)}')
+        self.tanev = Tanev.objects.create(start_date=date(2030, 9, 1), end_date=date(2031, 6, 15))
+
+    def post(self, items):
+        return self.client.post(self.url, json.dumps(items), content_type='application/json')
+
+    def test_creates_every_class_in_request_order(self):
+        items = [
+            {'start_year': 2030, 'szekcio': 'F', 'tanev_id': self.tanev.id},
+            {'start_year': 2028, 'szekcio': 'b'},
+            {'start_year': 2029, 'szekcio': 'a', 'tanev_id': self.tanev.id},
+        ]
+        response = self.post(items)
+
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual(
+            [(item['start_year'], item['szekcio']) for item in body],
+            [(2030, 'F'), (2028, 'B'), (2029, 'A')]
+        )
+        self.assertEqual(Osztaly.objects.count(), 3)
+
+    def test_szekcio_is_stored_upper_case(self):
+        response = self.post([{'start_year': 2030, 'szekcio': 'f'}])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Osztaly.objects.get().szekcio, 'F')
+
+    def test_links_classes_to_their_school_year(self):
+        response = self.post([
+            {'start_year': 2030, 'szekcio': 'A', 'tanev_id': self.tanev.id},
+            {'start_year': 2030, 'szekcio': 'B'},
+        ])
+
+        self.assertEqual(response.status_code, 201)
+        linked, unlinked = [Osztaly.objects.get(id=item['id']) for item in response.json()]
+        self.assertEqual(list(linked.tanevek.all()), [self.tanev])
+        self.assertEqual(list(unlinked.tanevek.all()), [])
+
+    def test_invalid_szekcio_rejects_the_whole_batch(self):
+        response = self.post([
+            {'start_year': 2030, 'szekcio': 'A'},
+            {'start_year': 2030, 'szekcio': 'AB'},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('#2', response.json()['message'])
+        self.assertFalse(Osztaly.objects.exists())
+
+    def test_missing_school_year_rejects_the_whole_batch(self):
+        response = self.post([
+            {'start_year': 2030, 'szekcio': 'A', 'tanev_id': self.tanev.id},
+            {'start_year': 2030, 'szekcio': 'B', 'tanev_id': self.tanev.id + 100},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Osztaly.objects.exists())
+
+    def test_failed_insert_creates_nothing(self):
+        TanevOsztaly = Tanev.osztalyok.through
+        with mock.patch.object(TanevOsztaly.objects, 'bulk_create', side_effect=IntegrityError('hiba')):
+            response = self.post([{'start_year': 2030, 'szekcio': 'A', 'tanev_id': self.tanev.id}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Osztaly.objects.exists())
+
+    def test_empty_batch_is_rejected(self):
+        self.assertEqual(self.post([]).status_code, 400)
+
+    def test_requires_admin(self):
+        student = User.objects.create_user('bulk_student', password='bulk-pass')
+        Profile.objects.create(user=student)
+        self.client = Client(HTTP_AUTHORIZATION=f'Bearer {generate_jwt_token(student)}')
+
+        response = self.post([{'start_year': 2030, 'szekcio': 'A'}])
+
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(Osztaly.objects.exists())
@@ -0,0 +1,132 @@
+"""
+Query count regression tests for the academic list endpoints.
+
+These tests pin the number of SQL queries the school year and class list
+endpoints issue, so a later change (e.g. a new field in a response builder)
+cannot silently reintroduce an N+1 query pattern. Every endpoint is called
+with two dataset sizes and the query count must be the same for both.
+
+Run with:
+    python manage.py test tests.test_academic_perf
+"""
+
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Profile, Tanev, Osztaly
+from backend.api_modules.auth import generate_jwt_token
+
+
+class AcademicQueryCountTests(TestCase):
+    """Pins the query count of the academic list endpoints."""
+
+    # JWT authentication (user with profile, last_login update),
+    # the active school year lookup and the list query (counts annotated).
+    SCHOOL_YEARS_QUERIES = 4
+    # Same as above plus one prefetch query for the school years of the classes.
+    CLASSES_QUERIES = 5
+
+    def setUp(self):
+        self.admin = User.objects.create_user('perf_admin', password='perf-pass')
+        Profile.objects.create(user=self.admin, admin_type='system_admin')
+        self.client = Client(HTTP_AUTHORIZATION=f'Bearer {generate_jwt_token(self.admin)}')
+
+    def create_school_years(self, count, classes_per_year=3):
+        """Create ``count`` school years, each with a few linked classes."""
+        for offset in range(count):
+            start_year = 2000 + offset
+            tanev = Tanev.objects.create(
+                start_date=date(start_year, 9, 1),
+                end_date=date(start_year + 1, 6, 15)
+            )
+            for szekcio in 'ABF'[:classes_per_year]:
+                osztaly = Osztaly.objects.create(startYear=start_year, szekcio=szekcio)
+                tanev.add_osztaly(osztaly)
+                # bulk_create skips the password hashing signal, which keeps setup fast
+                students = User.objects.bulk_create([
+                    User(username=f'student_{osztaly.id}_{index}') for index in range(2)
+                ])
+                Profile.objects.bulk_create([
+                    Profile(user=student, osztaly=osztaly) for student in students
+                ])
+
+    def count_queries(self, url):
+        # The active school year is cached; start every measurement cold.
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_school_years_query_count_is_constant(self):
+        self.create_school_years(2)
+        small = self.count_queries('/api/school-years')
+
+        self.create_school_years(20)
+        large = self.count_queries('/api/school-years')
+
+        self.assertEqual(small, large)
+        self.assertEqual(large, self.SCHOOL_YEARS_QUERIES)
+
+    def test_classes_query_count_is_constant(self):
+        self.create_school_years(2)
+        small = self.count_queries('/api/classes')
+
+        self.create_school_years(20)
+        large = self.count_queries('/api/classes')
+
+        self.assertEqual(small, large)
+        self.assertEqual(large, self.CLASSES_QUERIES)
+
+    def test_classes_by_section_query_count_is_constant(self):
+        self.create_school_years(2)
+        small = self.count_queries('/api/classes/by-section/f')
+
+        self.create_school_years(20)
+        large = self.count_queries('/api/classes/by-section/f')
+
+        self.assertEqual(small, large)
+        self.assertEqual(large, self.CLASSES_QUERIES)
+
+    def test_school_years_etag_returns_not_modified(self):
+        self.create_school_years(2)
+        response = self.client.get('/api/school-years')
+        etag = response['ETag']
+
+        response = self.client.get('/api/school-years', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # A new school year changes the list, so the old ETag no longer matches
+        self.create_school_years(1)
+        response = self.client.get('/api/school-years', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_classes_etag_returns_not_modified(self):
+        self.create_school_years(2)
+        response = self.client.get('/api/classes')
+        etag = response['ETag']
+
+        response = self.client.get('/api/classes', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        # A new student changes a class's student count
+        student = User.objects.create_user('etag_student')
+        Profile.objects.create(user=student, osztaly=Osztaly.objects.first())
+        response = self.client.get('/api/classes', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        # Linking a class to another school year changes its school years
+        etag = response['ETag']
+        oldest, newest = Tanev.objects.order_by('start_date')[:2]
+        oldest.add_osztaly(newest.osztalyok.first())
+        response = self.client.get('/api/classes', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
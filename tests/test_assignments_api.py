@@ -0,0 +1,372 @@
+"""
+Behaviour tests for the filming assignment (beosztás) endpoints.
+
+The endpoints are served from a separate NinjaAPI that only registers the
+assignment endpoints (this module is the test URLconf): in the main API the
+organization module's /assignments/{assignment_id} route is registered first
+and captures single-segment paths like /assignments/summary.
+
+Run with:
+    python manage.py test tests.test_assignments_api
+"""
+
+import json
+from datetime import date, time, timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import path
+from ninja import NinjaAPI
+
+from api.models import Absence, Beosztas, Forgatas, Osztaly, Profile, Szerepkor, SzerepkorRelaciok, Tanev
+from backend.api_modules import assignments
+from backend.api_modules.assignments import ASSIGNMENTS_SUMMARY_CACHE_KEY, register_assignment_endpoints
+from backend.api_modules.auth import generate_jwt_token
+
+assignment_api = NinjaAPI(urls_namespace='test_assignments_api')
+register_assignment_endpoints(assignment_api)
+
+urlpatterns = [path('api/', assignment_api.urls)]
+
+
+@override_settings(ROOT_URLCONF='tests.test_assignments_api')
+class AssignmentApiTestCase(TestCase):
+    """Shared fixtures: an admin, a class with students, roles and filmings."""
+
+    def setUp(self):
+        cache.clear()
+        today = date.today()
+        tanev = Tanev.objects.create(
+            start_date=date(today.year - 1, 9, 1),
+            end_date=date(today.year + 1, 6, 15)
+        )
+        osztaly = Osztaly.objects.create(startYear=today.year - 1, szekcio='F')
+        tanev.add_osztaly(osztaly)
+
+        self.admin = User.objects.create_user('test_admin', password='test-pass')
+        Profile.objects.create(user=self.admin, admin_type='system_admin')
+        self.client = Client(HTTP_AUTHORIZATION=f'Bearer {generate_jwt_token(self.admin)}')
+
+        self.students = []
+        for index in range(3):
+            student = User.objects.create_user(
+                f'test_student_{index}', password='test-pass',
+                first_name=f'Diák{index}', last_name='Teszt'
+            )
+            Profile.objects.create(user=student, osztaly=osztaly)
+            self.students.append(student)
+
+        self.roles = [Szerepkor.objects.create(name=f'Teszt szerepkör {index}') for index in range(2)]
+        self.forgatasok = [
+            Forgatas.objects.create(
+                name=f'Teszt forgatás {index}',
+                description='Teszt',
+                date=today + timedelta(days=7 + index),
+                timeFrom=time(10, 0),
+                timeTo=time(12, 0),
+                forgTipus='kacsa'
+            )
+            for index in range(3)
+        ]
+
+    def create_assignment(self, forgatas, pairs):
+        """Create an assignment through the API from (student, role) pairs."""
+        response = self.client.post('/api/assignments/filming-assignments', {
+            'forgatas_id': forgatas.id,
+            'student_role_pairs': [
+                {'user_id': student.id, 'szerepkor_id': role.id} for student, role in pairs
+            ]
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        return response.json()['id']
+
+
+class AssignmentSummaryCacheTests(AssignmentApiTestCase):
+    """The cached /assignments/summary is dropped when its source data changes."""
+
+    def get_summary(self):
+        response = self.client.get('/api/assignments/summary')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_summary_is_cached(self):
+        first = self.get_summary()
+        self.assertIsNotNone(cache.get(ASSIGNMENTS_SUMMARY_CACHE_KEY))
+        self.assertEqual(self.get_summary()['generated_at'], first['generated_at'])
+
+    def test_save_clears_cached_summary(self):
+        self.assertEqual(self.get_summary()['assignment_stats']['total_assignments'], 0)
+
+        beosztas = Beosztas.objects.create(forgatas=self.forgatasok[0], author=self.admin)
+        self.assertIsNone(cache.get(ASSIGNMENTS_SUMMARY_CACHE_KEY))
+        self.assertEqual(self.get_summary()['assignment_stats']['total_assignments'], 1)
+
+        beosztas.kesz = True
+        beosztas.save()
+        self.assertEqual(self.get_summary()['assignment_stats']['finalized_assignments'], 1)
+
+    def test_delete_clears_cached_summary(self):
+        beosztas = Beosztas.objects.create(forgatas=self.forgatasok[0], author=self.admin)
+        self.assertEqual(self.get_summary()['assignment_stats']['total_assignments'], 1)
+
+        beosztas.delete()
+        self.assertIsNone(cache.get(ASSIGNMENTS_SUMMARY_CACHE_KEY))
+        self.assertEqual(self.get_summary()['assignment_stats']['total_assignments'], 0)
+
+    def test_role_relation_change_clears_cached_summary(self):
+        beosztas = Beosztas.objects.create(forgatas=self.forgatasok[0], author=self.admin)
+        self.assertEqual(self.get_summary()['recent_activity'][0]['student_count'], 0)
+
+        # bulk_create sends no post_save, only the m2m add below invalidates
+        relation = SzerepkorRelaciok.objects.bulk_create([
+            SzerepkorRelaciok(user=self.students[0], szerepkor=self.roles[0])
+        ])[0]
+        self.get_summary()
+        beosztas.szerepkor_relaciok.add(relation)
+        self.assertIsNone(cache.get(ASSIGNMENTS_SUMMARY_CACHE_KEY))
+        self.assertEqual(self.get_summary()['recent_activity'][0]['student_count'], 1)
+
+        self.get_summary()
+        beosztas.szerepkor_relaciok.remove(relation)
+        self.assertEqual(self.get_summary()['recent_activity'][0]['student_count'], 0)
+
+
+class AssignmentActiveSchoolYearTests(AssignmentApiTestCase):
+    """New assignments are linked to the active school year, never to a stale cache entry."""
+
+    def test_new_assignment_gets_the_active_school_year(self):
+        beosztas = Beosztas.objects.create(forgatas=self.forgatasok[0], author=self.admin)
+
+        self.assertEqual(beosztas.tanev, Tanev.objects.get())
+
+    def test_stale_cached_school_year_is_not_written(self):
+        # A rolled back test or a raw delete leaves the id without a signal
+        cache.set(Tanev.active_cache_key(), Tanev.objects.get().id + 100)
+
+        beosztas = Beosztas.objects.create(forgatas=self.forgatasok[0], author=self.admin)
+
+        self.assertEqual(beosztas.tanev, Tanev.objects.get())
+        self.assertEqual(cache.get(Tanev.active_cache_key()), Tanev.objects.get().id)
+
+
+class AssignmentAvailabilityListTests(AssignmentApiTestCase):
+    """The streamed /assignments/filming-assignments-with-availability list."""
+
+    url = '/api/assignments/filming-assignments-with-availability'
+
+    def setUp(self):
+        super().setUp()
+        # Newest first, like the endpoint orders them
+        self.assignment_ids = [
+            self.create_assignment(forgatas, [(self.students[0], self.roles[0])])
+            for forgatas in self.forgatasok
+        ][::-1]
+
+    def test_streamed_body_and_total_count_header(self):
+        response = self.client.get(f'{self.url}?limit=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['X-Total-Count'], '3')
+
+        body = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([item['id'] for item in body], self.assignment_ids[:2])
+        self.assertEqual(body[0]['user_availability']['summary']['total_users'], 1)
+
+    def read_ids(self, query):
+        response = self.client.get(f'{self.url}?{query}')
+        self.assertEqual(response.status_code, 200)
+        return response, [item['id'] for item in json.loads(b''.join(response.streaming_content))]
+
+    def test_limit_and_offset_slice_the_ordered_list(self):
+        response, ids = self.read_ids('limit=2&offset=1')
+        self.assertEqual(ids, self.assignment_ids[1:3])
+        self.assertEqual(response['X-Total-Count'], '3')
+
+        response, ids = self.read_ids('limit=5&offset=3')
+        self.assertEqual(ids, [])
+        self.assertEqual(response['X-Total-Count'], '3')
+
+    def test_total_count_follows_the_filters(self):
+        forgatas_id = self.forgatasok[0].id
+        response, ids = self.read_ids(f'limit=1&forgatas_id={forgatas_id}')
+        self.assertEqual(ids, [self.assignment_ids[-1]])
+        self.assertEqual(response['X-Total-Count'], '1')
+
+    def test_without_limit_returns_everything_without_total(self):
+        response, ids = self.read_ids('offset=1')
+        self.assertEqual(ids, self.assignment_ids)
+        self.assertFalse(response.has_header('X-Total-Count'))
+
+    def test_invalid_paging_parameters_are_rejected(self):
+        for query in ('limit=0', 'limit=-1', 'limit=2&offset=-1'):
+            with self.subTest(query=query):
+                response = self.client.get(f'{self.url}?{query}')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('message', response.json())
+
+    def test_empty_list_is_valid_json(self):
+        # None of the assignments is finalized
+        response = self.client.get(f'{self.url}?kesz=true')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [])
+
+    def test_error_in_first_entry_returns_error_response(self):
+        with mock.patch(
+            'backend.api_modules.assignments.create_beosztas_with_availability_response',
+            side_effect=RuntimeError('hiba')
+        ):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        self.assertIn('hiba', response.json()['message'])
+
+    def test_error_after_streaming_started_aborts_response(self):
+        original = assignments.create_beosztas_with_availability_response
+        calls = []
+
+        def fail_on_second_entry(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError('hiba')
+            return original(*args, **kwargs)
+
+        with mock.patch(
+            'backend.api_modules.assignments.create_beosztas_with_availability_response',
+            side_effect=fail_on_second_entry
+        ):
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            with self.assertLogs('backend.api_modules.core', level='ERROR'):
+                with self.assertRaises(RuntimeError):
+                    b''.join(response.streaming_content)
+
+
+class AssignmentStatusTransitionTests(AssignmentApiTestCase):
+    """Repeated finalize, mark-done and mark-draft calls."""
+
+    def setUp(self):
+        super().setUp()
+        self.assignment_id = self.create_assignment(
+            self.forgatasok[0], [(self.students[0], self.roles[0]), (self.students[1], self.roles[1])]
+        )
+
+    def post(self, action):
+        response = self.client.post(f'/api/assignments/filming-assignments/{self.assignment_id}/{action}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def absent_student_ids(self):
+        return set(Absence.objects.filter(
+            forgatas=self.forgatasok[0], auto_generated=True
+        ).values_list('diak_id', flat=True))
+
+    def assert_repeat_backfills_absences(self, action):
+        self.assertTrue(self.post(action)['kesz'])
+        self.assertEqual(self.absent_student_ids(), {self.students[0].id, self.students[1].id})
+
+        # An absence lost by an earlier, partially failed attempt
+        Absence.objects.filter(diak=self.students[1], forgatas=self.forgatasok[0]).delete()
+        mails_before = len(mail.outbox)
+
+        with mock.patch.object(Beosztas, 'save', autospec=True, side_effect=Beosztas.save) as save:
+            self.assertTrue(self.post(action)['kesz'])
+        self.assertEqual(self.absent_student_ids(), {self.students[0].id, self.students[1].id})
+        # No new save and no notification for the already finalized assignment
+        save.assert_not_called()
+        self.assertEqual(len(mail.outbox), mails_before)
+
+    def test_repeated_finalize_backfills_missing_absences(self):
+        self.assert_repeat_backfills_absences('finalize')
+
+    def test_repeated_mark_done_backfills_missing_absences(self):
+        self.assert_repeat_backfills_absences('mark-done')
+
+    def test_repeated_mark_draft_keeps_draft(self):
+        self.post('finalize')
+        self.assertFalse(self.post('mark-draft')['kesz'])
+        self.assertEqual(self.absent_student_ids(), set())
+
+        mails_before = len(mail.outbox)
+        self.assertFalse(self.post('mark-draft')['kesz'])
+        self.assertFalse(Beosztas.objects.get(id=self.assignment_id).kesz)
+        self.assertEqual(self.absent_student_ids(), set())
+        self.assertEqual(len(mail.outbox), mails_before)
+
+    def test_finalize_after_mark_draft_recreates_absences(self):
+        self.post('finalize')
+        self.post('mark-draft')
+        self.assertTrue(self.post('finalize')['kesz'])
+        self.assertEqual(self.absent_student_ids(), {self.students[0].id, self.students[1].id})
+
+
+class AssignmentUpdateRelationTests(AssignmentApiTestCase):
+    """update_filming_assignment applies only the changed role relations."""
+
+    def setUp(self):
+        super().setUp()
+        self.forgatas = self.forgatasok[0]
+        self.assignment_id = self.create_assignment(
+            self.forgatas, [(self.students[0], self.roles[0]), (self.students[1], self.roles[1])]
+        )
+
+    def update(self, pairs):
+        response = self.client.put(f'/api/assignments/filming-assignments/{self.assignment_id}', {
+            'student_role_pairs': [
+                {'user_id': student.id, 'szerepkor_id': role.id} for student, role in pairs
+            ]
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def relation_ids(self):
+        return {
+            (relation.user_id, relation.szerepkor_id): relation.id
+            for relation in Beosztas.objects.get(id=self.assignment_id).szerepkor_relaciok.all()
+        }
+
+    def absent_student_ids(self):
+        return set(Absence.objects.filter(
+            forgatas=self.forgatas, auto_generated=True
+        ).values_list('diak_id', flat=True))
+
+    def test_unchanged_pairs_keep_their_relations(self):
+        before = self.relation_ids()
+        self.update([(self.students[0], self.roles[0]), (self.students[1], self.roles[1])])
+        self.assertEqual(self.relation_ids(), before)
+        self.assertEqual(self.absent_student_ids(), {self.students[0].id, self.students[1].id})
+
+    def test_removed_and_added_pairs(self):
+        before = self.relation_ids()
+        kept = (self.students[0].id, self.roles[0].id)
+        self.assertEqual(self.absent_student_ids(), {self.students[0].id, self.students[1].id})
+
+        response = self.update([(self.students[0], self.roles[0]), (self.students[2], self.roles[0])])
+
+        after = self.relation_ids()
+        self.assertEqual(set(after), {kept, (self.students[2].id, self.roles[0].id)})
+        # The unchanged pair keeps its relation, the removed one is deleted
+        self.assertEqual(after[kept], before[kept])
+        removed_id = before[(self.students[1].id, self.roles[1].id)]
+        self.assertFalse(SzerepkorRelaciok.objects.filter(id=removed_id).exists())
+        # The removed student's auto absence is gone, the new student has one
+        self.assertEqual(self.absent_student_ids(), {self.students[0].id, self.students[2].id})
+        self.assertEqual(response['student_count'], 2)
+
+    def test_role_change_replaces_the_relation_and_keeps_the_absence(self):
+        before = self.relation_ids()
+        self.update([(self.students[0], self.roles[1]), (self.students[1], self.roles[1])])
+
+        after = self.relation_ids()
+        self.assertNotIn((self.students[0].id, self.roles[0].id), after)
+        self.assertNotIn(after[(self.students[0].id, self.roles[1].id)], before.values())
+        self.assertEqual(
+            after[(self.students[1].id, self.roles[1].id)], before[(self.students[1].id, self.roles[1].id)]
+        )
+        self.assertEqual(self.absent_student_ids(), {self.students[0].id, self.students[1].id})
+
+    def test_duplicate_pairs_create_one_relation(self):
+        self.update([(self.students[2], self.roles[0]), (self.students[2], self.roles[0])])
+        self.assertEqual(set(self.relation_ids()), {(self.students[2].id, self.roles[0].id)})
+        self.assertEqual(self.absent_student_ids(), {self.students[2].id})
@@ -0,0 +1,117 @@
+"""
+Query count regression tests for the filming assignment response builders.
+
+The assignment list endpoints serialize every assignment with
+create_beosztas_response. These tests pin the number of SQL queries needed
+to serialize a list loaded through get_beosztas_queryset, so a later change
+cannot silently reintroduce a query per assignment or per role relation.
+
+Run with:
+    python manage.py test tests.test_assignments_perf
+"""
+
+from datetime import date, time
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Beosztas, Forgatas, Stab, Szerepkor, SzerepkorRelaciok
+from backend.api_modules.assignments import (
+    create_beosztas_response, create_beosztas_with_availability_response, get_beosztas_queryset
+)
+
+
+class AssignmentQueryCountTests(TestCase):
+    """Pins the query count of the assignment list serialization."""
+
+    # The assignment query (forgatas, szerkeszto, author, stab joined)
+    # and one prefetch query for the role relations with user and role.
+    ASSIGNMENT_LIST_QUERIES = 2
+    # Same as above plus the vacation, radio session and other assignment
+    # conflicts of all assigned students (one query each).
+    AVAILABILITY_QUERIES = 5
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user('perf_author', password='perf-pass')
+        self.stab = Stab.objects.create(name='Perf stáb')
+        self.roles = [Szerepkor.objects.create(name=f'Perf szerepkör {index}') for index in range(2)]
+
+    def create_assignments(self, count, students_per_assignment=3):
+        """Create ``count`` assignments, each with a few students in roles."""
+        start = Beosztas.objects.count()
+        for offset in range(start, start + count):
+            forgatas = Forgatas.objects.create(
+                name=f'Perf forgatás {offset}',
+                description='Teszt',
+                date=date(2030, 1, 1 + offset % 28),
+                timeFrom=time(10, 0),
+                timeTo=time(12, 0),
+                forgTipus='kacsa',
+                szerkeszto=self.author
+            )
+            beosztas = Beosztas.objects.create(forgatas=forgatas, author=self.author, stab=self.stab)
+            # bulk_create skips the password hashing signal, which keeps setup fast
+            students = User.objects.bulk_create([
+                User(username=f'perf_student_{offset}_{index}') for index in range(students_per_assignment)
+            ])
+            relations = SzerepkorRelaciok.objects.bulk_create([
+                SzerepkorRelaciok(user=student, szerepkor=self.roles[index % 2])
+                for index, student in enumerate(students)
+            ])
+            beosztas.szerepkor_relaciok.add(*relations)
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            responses = [create_beosztas_response(beosztas) for beosztas in get_beosztas_queryset()]
+        return len(context.captured_queries), responses
+
+    def test_assignment_list_query_count_is_constant(self):
+        self.create_assignments(2)
+        small, _ = self.count_queries()
+
+        self.create_assignments(10)
+        large, responses = self.count_queries()
+
+        self.assertEqual(small, large)
+        self.assertEqual(large, self.ASSIGNMENT_LIST_QUERIES)
+        self.assertEqual(len(responses), 12)
+        self.assertEqual(responses[0]['student_count'], 3)
+        self.assertEqual(responses[0]['forgatas']['szerkeszto']['username'], 'perf_author')
+
+    def test_assignment_list_builds_shared_users_and_roles_once(self):
+        self.create_assignments(3)
+        user_responses, role_responses = {}, {}
+        responses = [
+            create_beosztas_response(beosztas, user_responses, role_responses)
+            for beosztas in get_beosztas_queryset()
+        ]
+
+        # One author and nine students, two roles across all assignments
+        self.assertEqual(len(user_responses), 10)
+        self.assertEqual(len(role_responses), 2)
+        self.assertIs(responses[0]['author'], responses[2]['author'])
+        self.assertIs(
+            responses[0]['szerepkor_relaciok'][0]['szerepkor'],
+            responses[2]['szerepkor_relaciok'][0]['szerepkor']
+        )
+
+    def count_availability_queries(self, forgatas_name):
+        with CaptureQueriesContext(connection) as context:
+            beosztas = get_beosztas_queryset().get(forgatas__name=forgatas_name)
+            response = create_beosztas_with_availability_response(beosztas)
+        return len(context.captured_queries), response
+
+    def test_availability_query_count_does_not_grow_with_students(self):
+        self.create_assignments(1, students_per_assignment=2)
+        small, _ = self.count_availability_queries('Perf forgatás 0')
+
+        self.create_assignments(1, students_per_assignment=10)
+        large, response = self.count_availability_queries('Perf forgatás 1')
+
+        self.assertEqual(small, large)
+        self.assertEqual(large, self.AVAILABILITY_QUERIES)
+        self.assertEqual(response['user_availability']['summary']['available_count'], 10)